@@ -9,8 +9,6 @@ import sys
 import json
 from datetime import datetime
 
-sys.path.append(os.path.dirname(__file__))
-
 from google_sheets_auth import authenticate_google_sheets, read_sheet, write_to_sheet
 
 def add_enrichment_to_sheet():
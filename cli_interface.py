@@ -7,10 +7,25 @@ Provides predatory command-line experience for lead enrichment operations
 import os
 import sys
 import time
+import importlib.util
 from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime
 
-try:
+# Cheap availability probe: find_spec doesn't import the package, so plain
+# module import stays fast for non-tty runs (CI, cron) that never use rich
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
+_RICH_LOADED = False
+
+
+def _load_rich() -> bool:
+    """Import the rich machinery on first interactive use."""
+    global _RICH_LOADED
+    if _RICH_LOADED:
+        return True
+    if not RICH_AVAILABLE:
+        return False
+
+    from rich import box
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
@@ -27,10 +42,19 @@ try:
     from rich.text import Text
     from rich.layout import Layout
     from rich.live import Live
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+
+    globals().update(
+        box=box, Console=Console, Table=Table, Panel=Panel,
+        Progress=Progress, SpinnerColumn=SpinnerColumn,
+        TextColumn=TextColumn, BarColumn=BarColumn,
+        TaskProgressColumn=TaskProgressColumn,
+        TimeElapsedColumn=TimeElapsedColumn,
+        TimeRemainingColumn=TimeRemainingColumn,
+        Prompt=Prompt, IntPrompt=IntPrompt, Confirm=Confirm,
+        Text=Text, Layout=Layout, Live=Live,
+    )
+    _RICH_LOADED = True
+    return True
 
 from google_sheets_auth import (
     parse_sheet_id_from_url,
@@ -44,8 +68,10 @@ class CLIInterface:
     """🦈 LeadShark enhanced CLI interface with predatory formatting and interactive lead hunting features"""
 
     def __init__(self):
-        self.console = Console() if RICH_AVAILABLE else None
-        self.use_rich = RICH_AVAILABLE
+        # Piped/CI output gets the plain-text path and never pays the
+        # rich import cost
+        self.use_rich = sys.stdout.isatty() and _load_rich()
+        self.console = Console() if self.use_rich else None
 
         # Progress tracking
         self.current_progress = None
@@ -471,7 +497,7 @@ if __name__ == "__main__":
     print(f"Selected options: {options}")
 
     # Test progress (simulation)
-    if RICH_AVAILABLE:
+    if cli.use_rich:
         progress = cli.create_progress_display(5, "Test", "Sample Sheet")
 
         with progress:
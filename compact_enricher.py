@@ -10,11 +10,10 @@ import json
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
-sys.path.append(os.path.dirname(__file__))
-
-from google_sheets_auth import authenticate_google_sheets
+from google_sheets_auth import get_cached_credentials
 from data_enrichment import DataEnrichment
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
@@ -36,15 +35,25 @@ COMPACT_ENRICH_HEADERS = [
 class CompactEnricher:
     """Compact enricher using only 5 columns for all enrichment data"""
 
-    def __init__(self, sheet_id: str, dry_run: bool = False):
+    def __init__(self, sheet_id: str, dry_run: bool = False, batch_size: int = 50,
+                 max_workers: int = 8):
         self.sheet_id = sheet_id
         self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.max_workers = max_workers
         self.service = None
         self.drive_service = None
         self.enricher = DataEnrichment()
         self.scraper = EnhancedScrapingPipeline()
         self.cli = None
 
+        # Buffered writes (flushed every batch_size rows via values.batchUpdate).
+        # A failed flush keeps the buffer for the next attempt; rows only
+        # count as updated once their flush lands
+        self._pending_updates = []
+        self._pending_rows = 0
+        self._rows_flushed = 0
+
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -60,7 +69,7 @@ class CompactEnricher:
         """Authenticate with Google Sheets"""
         try:
             self.logger.info("Authenticating with Google Sheets API...")
-            result = authenticate_google_sheets()
+            result = get_cached_credentials()
             if result:
                 self.service, self.drive_service, creds = result
                 return True
@@ -371,40 +380,52 @@ class CompactEnricher:
             headers = sheet_data[0]
             data_rows = sheet_data[1:max_rows + 1 if max_rows else len(sheet_data)]
 
-            # Process rows
-            for idx, row in enumerate(data_rows, start=1):
-                stats['rows_attempted'] += 1
-
-                # Convert to dict
-                row_dict = {}
-                for col_idx, value in enumerate(row):
-                    if col_idx < len(headers):
-                        row_dict[headers[col_idx]] = value
-
-                # Process row
-                try:
-                    compact_data = self.process_row_compact(row_dict, idx)
-
-                    # Write to sheet
-                    if self._write_compact_data(idx, compact_data, enrich_columns):
-                        stats['rows_updated'] += 1
-
-                        # Update stats based on status
-                        status_json = compact_data.get(f"{ENRICH_PREFIX}Status & Meta", '{}')
-                        try:
-                            status_data = json.loads(status_json)
-                            status = status_data.get('status', 'FAILED').lower()
-                            stats[status] = stats.get(status, 0) + 1
-                        except:
-                            stats['failed'] += 1
-
-                    # Rate limiting
-                    time.sleep(1)
-
-                except Exception as e:
-                    self.logger.error(f"Row {idx} failed: {e}")
-                    stats['errors'].append(f"Row {idx}: {str(e)}")
-                    stats['failed'] += 1
+            # Process rows concurrently: enrichment is network-bound and
+            # rows are independent, while writes and stats stay on this
+            # thread so the batch buffer needs no locking
+            work = [(idx, dict(zip(headers, row)))
+                    for idx, row in enumerate(data_rows, start=1)]
+            rows_queued = 0
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(work)) or 1) as executor:
+                futures = {
+                    executor.submit(self.process_row_compact, row_dict, idx): idx
+                    for idx, row_dict in work
+                }
+
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    stats['rows_attempted'] += 1
+
+                    try:
+                        compact_data = future.result()
+
+                        # Write to sheet (buffered; counted as updated
+                        # only once its flush lands)
+                        if self._write_compact_data(idx, compact_data, enrich_columns):
+                            rows_queued += 1
+
+                            # Update stats based on status
+                            status_json = compact_data.get(f"{ENRICH_PREFIX}Status & Meta", '{}')
+                            try:
+                                status_data = json.loads(status_json)
+                                status = status_data.get('status', 'FAILED').lower()
+                                stats[status] = stats.get(status, 0) + 1
+                            except:
+                                stats['failed'] += 1
+
+                    except Exception as e:
+                        self.logger.error(f"Row {idx} failed: {e}")
+                        stats['errors'].append(f"Row {idx}: {str(e)}")
+                        stats['failed'] += 1
+
+            # Flush any updates still buffered below the batch threshold;
+            # this also retries ranges a mid-run flush failed to write
+            if self.dry_run:
+                stats['rows_updated'] = rows_queued
+            else:
+                self.flush_pending_updates()
+                stats['rows_updated'] = self._rows_flushed
 
         except Exception as e:
             self.logger.error(f"Processing failed: {e}")
@@ -431,18 +452,12 @@ class CompactEnricher:
                 self.logger.info(f"[DRY RUN] Would write to row {row_index + 1}: {len(requests)} columns")
                 return True
 
-            if requests:
-                body = {
-                    'valueInputOption': 'RAW',
-                    'data': requests
-                }
-
-                self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=self.sheet_id,
-                    body=body
-                ).execute()
+            # Buffer the update; one batchUpdate covers many rows
+            self._pending_updates.extend(requests)
+            self._pending_rows += 1
 
-                return True
+            if len(self._pending_updates) >= self.batch_size:
+                return self.flush_pending_updates()
 
         except Exception as e:
             self.logger.error(f"Write failed for row {row_index}: {e}")
@@ -450,6 +465,34 @@ class CompactEnricher:
 
         return True
 
+    def flush_pending_updates(self) -> bool:
+        """Flush buffered row updates in a single values.batchUpdate call"""
+        if not self._pending_updates:
+            return True
+
+        try:
+            body = {
+                'valueInputOption': 'RAW',
+                'data': self._pending_updates
+            }
+
+            self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.sheet_id,
+                body=body
+            ).execute()
+
+            self.logger.info(f"Flushed {len(self._pending_updates)} buffered ranges")
+            self._rows_flushed += self._pending_rows
+            self._pending_updates = []
+            self._pending_rows = 0
+            return True
+
+        except Exception as e:
+            # Keep the buffer: the next flush (including the final one)
+            # retries these ranges instead of silently dropping them
+            self.logger.error(f"Failed to flush batched updates (will retry): {e}")
+            return False
+
     def _extract_urls(self, row_data: Dict[str, str]) -> List[str]:
         """Extract URLs from row data"""
         urls = []
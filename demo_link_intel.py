@@ -6,7 +6,6 @@ Shows how the system processes links from Google Sheets
 
 import sys
 import os
-sys.path.append(os.path.dirname(__file__))
 
 from link_intelligence_orchestrator import LinkIntelligenceOrchestrator
 
@@ -45,7 +44,7 @@ def demo_link_discovery():
         'USER_AGENT_ID': 'LinkIntelBot/1.0',
         'ROBOTS_RESPECT': True,
         'DELAY_RANDOMIZATION_MS': (800, 2500),
-        'RETRY_POLICY': {'attempts': 3, 'backoff': [2, 4, 8]},
+        'RETRY_POLICY': {'attempts': 3},
         'FORCE_REFRESH': False
     }
 
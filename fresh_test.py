@@ -17,8 +17,6 @@ for module_name in modules_to_reload:
     if module_name in sys.modules:
         del sys.modules[module_name]
 
-sys.path.append(os.path.dirname(__file__))
-
 # Fresh import
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
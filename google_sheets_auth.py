@@ -1,13 +1,33 @@
 import os
 import json
 import re
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime
 from typing import Optional, Dict, List, Tuple
+from cachetools import TTLCache
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from tenacity import (Retrying, retry_if_exception, stop_after_attempt,
+                      wait_random_exponential)
+
+def _is_retryable_sheets_error(exc):
+    """Rate-limit and transient server errors are worth retrying; everything
+    else (bad range, missing sheet, auth) fails the same way every time."""
+    return isinstance(exc, HttpError) and exc.resp.status in (429, 500, 502, 503)
+
+# Jittered exponential backoff for Sheets writes, shared across callers
+_sheets_write_retryer = Retrying(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception(_is_retryable_sheets_error),
+    reraise=True
+)
 
 # Required scopes for full functionality
 SCOPES = [
@@ -56,7 +76,9 @@ def authenticate_google_sheets(force_consent: bool = False, show_progress: bool
             if show_progress and creds and creds.valid:
                 # Get user info to show connected account
                 try:
-                    service = build('oauth2', 'v2', credentials=creds)
+                    service = build('oauth2', 'v2', credentials=creds,
+                                    cache_discovery=False,
+                                    static_discovery=True)
                     user_info = service.userinfo().get().execute()
                     email = user_info.get('email', 'Unknown')
                     print(f"Google connected as {email}")
@@ -120,16 +142,84 @@ def authenticate_google_sheets(force_consent: bool = False, show_progress: bool
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
 
-    # Build services
+    # Build services from the discovery documents bundled with the client
+    # library - skips the discovery round-trip and the legacy file cache
     try:
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        sheets_service = build('sheets', 'v4', credentials=creds,
+                               cache_discovery=False, static_discovery=True)
+        drive_service = build('drive', 'v3', credentials=creds,
+                              cache_discovery=False, static_discovery=True)
         return sheets_service, drive_service, creds
     except HttpError as err:
         if show_progress:
             print(f"Failed to build Google services: {err}")
         return None
 
+class TokenProvider:
+    """
+    Process-wide credential cache with early background refresh.
+
+    Keeps the (sheets_service, drive_service, creds) tuple from the first
+    successful authentication and hands it back on later calls. When the
+    cached token is within REFRESH_MARGIN_SECONDS of expiry, a background
+    thread refreshes it while the still-valid token is returned immediately,
+    so the OAuth round-trip never blocks the hot path. A lock collapses
+    concurrent refreshes to a single outbound request.
+    """
+
+    REFRESH_MARGIN_SECONDS = 300  # Refresh when less than 5 minutes remain
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._result = None
+
+    def get(self, force_consent: bool = False, show_progress: bool = True):
+        """Return cached services/credentials, authenticating if needed"""
+        with self._lock:
+            if self._result and not force_consent:
+                creds = self._result[2]
+                if creds and creds.valid:
+                    self._maybe_schedule_refresh(creds)
+                    return self._result
+
+            self._result = authenticate_google_sheets(force_consent, show_progress)
+            return self._result
+
+    def _maybe_schedule_refresh(self, creds):
+        """Kick off a background refresh shortly before token expiry"""
+        if self._refreshing or not creds.refresh_token or not creds.expiry:
+            return
+
+        remaining = (creds.expiry - datetime.utcnow()).total_seconds()
+        if remaining < self.REFRESH_MARGIN_SECONDS:
+            self._refreshing = True
+            threading.Thread(target=self._refresh, args=(creds,), daemon=True).start()
+
+    def _refresh(self, creds):
+        try:
+            creds.refresh(Request())
+            with open('token.json', 'w') as token:
+                token.write(creds.to_json())
+        except Exception as e:
+            print(f"Background token refresh failed: {e}")
+        finally:
+            self._refreshing = False
+
+
+# Shared provider so every runner in the process reuses one credential set
+_token_provider = TokenProvider()
+
+
+def get_cached_credentials(force_consent: bool = False, show_progress: bool = True):
+    """
+    Drop-in replacement for authenticate_google_sheets that caches the
+    authenticated services for the lifetime of the process and refreshes
+    the token in the background shortly before it expires.
+    """
+    return _token_provider.get(force_consent, show_progress)
+
+
 def read_sheet(service, spreadsheet_id, range_name):
     """Read data from a Google Sheet"""
     try:
@@ -168,6 +258,36 @@ def write_to_sheet(service, spreadsheet_id, range_name, values):
         print(f"An error occurred: {err}")
         return None
 
+def batch_write_to_sheet(service, spreadsheet_id, data, value_input_option='USER_ENTERED'):
+    """Write multiple ranges to a Google Sheet in one API call
+
+    Args:
+        service: Authenticated Sheets service
+        spreadsheet_id: Target spreadsheet ID
+        data: List of {'range': range_name, 'values': rows} dicts
+        value_input_option: How input data should be interpreted
+
+    Returns:
+        Batch update response, or None on error
+    """
+    body = {
+        'valueInputOption': value_input_option,
+        'data': data
+    }
+    try:
+        for attempt in _sheets_write_retryer:
+            with attempt:
+                result = service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body
+                ).execute()
+
+        print(f"{result.get('totalUpdatedCells')} cells updated.")
+        return result
+    except HttpError as err:
+        print(f"An error occurred: {err}")
+        return None
+
 def append_to_sheet(service, spreadsheet_id, range_name, values):
     """Append data to a Google Sheet"""
     try:
@@ -206,26 +326,22 @@ def create_new_spreadsheet(service, title):
         print(f"An error occurred: {err}")
         return None
 
+# Both accepted shapes in one pass: a spreadsheets/d/<id> URL (standard,
+# relative or full-domain) or a bare ID - one long run of the characters
+# Google uses - pasted on its own
+_SHEET_INPUT_RE = re.compile(
+    r'spreadsheets/d/([a-zA-Z0-9-_]+)|^([a-zA-Z0-9-_]{20,})$')
+
+
+@lru_cache(maxsize=128)
 def parse_sheet_id_from_url(sheet_input: str) -> Optional[str]:
     """Parse Google Sheet ID from URL or return raw ID"""
     if not sheet_input:
         return None
 
-    # If it's already just an ID (no slashes or dots)
-    if '/' not in sheet_input and '.' not in sheet_input and len(sheet_input) > 20:
-        return sheet_input.strip()
-
-    # Extract from full URL patterns
-    patterns = [
-        r'spreadsheets/d/([a-zA-Z0-9-_]+)',  # Standard URL
-        r'/spreadsheets/d/([a-zA-Z0-9-_]+)',  # Relative URL
-        r'docs\.google\.com/spreadsheets/d/([a-zA-Z0-9-_]+)',  # Full domain
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, sheet_input)
-        if match:
-            return match.group(1)
+    match = _SHEET_INPUT_RE.search(sheet_input.strip())
+    if match:
+        return match.group(1) or match.group(2)
 
     return None
 
@@ -233,20 +349,27 @@ def parse_sheet_id_from_url(sheet_input: str) -> Optional[str]:
 def get_sheet_metadata(sheets_service, drive_service, sheet_id: str) -> Optional[Dict]:
     """Get comprehensive sheet metadata including worksheets"""
     try:
-        # Get spreadsheet metadata
-        spreadsheet = sheets_service.spreadsheets().get(
-            spreadsheetId=sheet_id,
-            includeGridData=False
-        ).execute()
-
-        # Get file metadata from Drive for additional info
-        try:
-            file_info = drive_service.files().get(
-                fileId=sheet_id,
-                fields="name,owners,createdTime,modifiedTime,webViewLink"
-            ).execute()
-        except:
-            file_info = {}
+        # The Sheets and Drive lookups are independent round-trips, so
+        # they run side by side instead of back to back
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spreadsheet_future = executor.submit(
+                sheets_service.spreadsheets().get(
+                    spreadsheetId=sheet_id,
+                    includeGridData=False
+                ).execute)
+            file_info_future = executor.submit(
+                drive_service.files().get(
+                    fileId=sheet_id,
+                    fields="name,owners,createdTime,modifiedTime,webViewLink"
+                ).execute)
+
+            spreadsheet = spreadsheet_future.result()
+
+            # Drive info is optional extra detail; ignore its failures
+            try:
+                file_info = file_info_future.result()
+            except:
+                file_info = {}
 
         # Process worksheets
         sheets = []
@@ -290,6 +413,43 @@ def get_sheet_metadata(sheets_service, drive_service, sheet_id: str) -> Optional
         return None
 
 
+def get_sheet_bundle(sheets_service, drive_service, sheet_id: str, preview_rows: int = 4) -> Optional[Dict]:
+    """Fetch sheet metadata plus previews of every worksheet together
+
+    One spreadsheets.get covers the metadata and a single values.batchGet
+    returns the first rows of all worksheets, instead of paying one
+    values.get round-trip per worksheet on top of the metadata calls.
+
+    Returns:
+        {'metadata': ..., 'previews': {sheet_title: preview_dict}} or None
+    """
+    metadata = get_sheet_metadata(sheets_service, drive_service, sheet_id)
+    if not metadata:
+        return None
+
+    previews = {}
+    ranges = [f"'{sheet['title']}'!A1:Z{preview_rows}" for sheet in metadata['sheets']]
+    if ranges:
+        try:
+            result = sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=ranges
+            ).execute()
+
+            for sheet, value_range in zip(metadata['sheets'], result.get('valueRanges', [])):
+                values = value_range.get('values', [])
+                previews[sheet['title']] = {
+                    'headers': values[0] if values else [],
+                    'preview_rows': values[1:] if len(values) > 1 else [],
+                    'total_rows': max(sheet.get('rowCount', 0) - 1, 0),
+                    'sheet_name': sheet['title']
+                }
+        except HttpError as err:
+            print(f"Error reading sheet previews: {err}")
+
+    return {'metadata': metadata, 'previews': previews}
+
+
 def preview_sheet_data(sheets_service, sheet_id: str, sheet_name: str = None, max_rows: int = 4) -> Optional[Dict]:
     """Get preview of sheet data (headers + first few rows)"""
     try:
@@ -332,11 +492,22 @@ def preview_sheet_data(sheets_service, sheet_id: str, sheet_name: str = None, ma
         return None
 
 
+# Sheet metadata changes rarely; the validate -> preview -> process flow
+# (and repeated runs against the same sheet) should cost one metadata
+# fetch, not one per step. Failures are never cached.
+_metadata_cache = TTLCache(maxsize=128, ttl=600)
+
+
 def validate_sheet_access(sheets_service, drive_service, sheet_id: str) -> Tuple[bool, Optional[Dict]]:
     """Validate access to sheet and return metadata if successful"""
+    cached_metadata = _metadata_cache.get(sheet_id)
+    if cached_metadata is not None:
+        return True, cached_metadata
+
     try:
         metadata = get_sheet_metadata(sheets_service, drive_service, sheet_id)
         if metadata:
+            _metadata_cache[sheet_id] = metadata
             return True, metadata
         return False, None
     except Exception as e:
@@ -12,8 +12,6 @@ import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
-sys.path.append(os.path.dirname(__file__))
-
 from google_sheets_auth import authenticate_google_sheets, read_sheet, write_to_sheet
 from data_enrichment import DataEnrichment
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
@@ -10,18 +10,25 @@ import json
 import time
 import re
 import random
+import asyncio
 import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple, Set
 from urllib.parse import urlparse, urljoin, urlunparse, parse_qs
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
 import requests
+import aiohttp
+import diskcache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from googleapiclient.errors import HttpError
+from tenacity import (Retrying, retry_if_exception, stop_after_attempt,
+                      wait_random_exponential)
 import traceback
 
-sys.path.append(os.path.dirname(__file__))
-
 from google_sheets_auth import authenticate_google_sheets
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
@@ -30,6 +37,44 @@ ORCHESTRATOR_VERSION = "v1.0-LinkIntel"
 SCHEMA_VERSION = "LIO-1.0"
 AX_COLUMN_INDEX = 49  # Column AX is index 49 (0-based)
 
+# Scraped intel survives across runs for a week before pages are refetched
+LINK_CACHE_DIR = '.cache/links'
+LINK_CACHE_TTL_SECONDS = 86400 * 7
+
+# Single alternation regex so CTA detection is one DOM text pass instead
+# of one full find_all() walk per keyword
+_CTA_RE = re.compile(
+    r'get started|try free|sign up|demo|pricing|plans|buy now|contact sales',
+    re.IGNORECASE)
+
+# Transient failures worth retrying (scrapes and Sheets writes)
+RETRYABLE_ERRORS = (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout)
+
+
+def _is_retryable_error(exc) -> bool:
+    """Network hiccups always retry; Sheets errors only when transient.
+
+    A 403/404 HttpError fails identically on every attempt, so burning
+    the backoff budget on it just slows the run down.
+    """
+    if isinstance(exc, RETRYABLE_ERRORS):
+        return True
+    return isinstance(exc, HttpError) and exc.resp.status in (429, 500, 502, 503)
+
+
+@dataclass(slots=True)
+class RunStats:
+    """Aggregate counters for a single orchestrator run."""
+    rows_processed: int = 0
+    links_found: int = 0
+    links_processed: int = 0
+    links_skipped: int = 0
+    errors: int = 0
+    columns_created: int = 0
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
 class LinkIntelligenceOrchestrator:
     """
     Comprehensive link intelligence system with search, scrape, and scoring capabilities.
@@ -54,8 +99,9 @@ class LinkIntelligenceOrchestrator:
         self.user_agent_id = config.get('USER_AGENT_ID', 'LinkIntelBot/1.0')
         self.robots_respect = config.get('ROBOTS_RESPECT', True)
         self.delay_randomization_ms = config.get('DELAY_RANDOMIZATION_MS', (800, 2500))
-        self.retry_policy = config.get('RETRY_POLICY', {'attempts': 3, 'backoff': [2, 4, 8]})
+        self.retry_policy = config.get('RETRY_POLICY', {'attempts': 3})
         self.force_refresh = config.get('FORCE_REFRESH', False)
+        self.concurrency = config.get('CONCURRENCY', 20)
 
         # Google Sheets services
         self.service = None
@@ -64,23 +110,44 @@ class LinkIntelligenceOrchestrator:
         # Scraping pipeline
         self.scraper = EnhancedScrapingPipeline()
 
+        # Persistent HTTP session: pooled keep-alive connections avoid a
+        # fresh TCP+TLS handshake per link on the search path
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=256,
+            max_retries=Retry(
+                total=self.retry_policy['attempts'],
+                backoff_factor=2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({'Connection': 'keep-alive'})
+
+        # Jittered exponential retries: spreads concurrent retry attempts so
+        # they don't collide on the server, and skips non-retryable errors
+        self.retryer = Retrying(
+            wait=wait_random_exponential(min=1, max=30),
+            stop=stop_after_attempt(self.retry_policy['attempts']),
+            retry=retry_if_exception(_is_retryable_error),
+            reraise=True
+        )
+
+        # Durable scrape cache: re-runs skip already-fetched pages entirely
+        # unless FORCE_REFRESH is set
+        self.link_cache = diskcache.Cache(LINK_CACHE_DIR)
+
         # State tracking
         self.links_processed_today = 0
+        self._throttle_until = 0.0  # Pipeline-wide pause requested by rate-limit headers
         self.processing_ledger = {}  # (row_id, url) -> status
         self.column_mapping = {}  # header -> column index
         self.next_empty_column = AX_COLUMN_INDEX + 1  # Start after AX
 
         # Statistics
-        self.stats = {
-            'rows_processed': 0,
-            'links_found': 0,
-            'links_processed': 0,
-            'links_skipped': 0,
-            'errors': 0,
-            'columns_created': 0,
-            'start_time': None,
-            'end_time': None
-        }
+        self.stats = RunStats()
 
         # Setup logging
         self._setup_logging()
@@ -311,14 +378,14 @@ class LinkIntelligenceOrchestrator:
 
             # Search for company info
             search_url = f"https://www.google.com/search?q={requests.utils.quote(query)}&num=10"
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.http.get(search_url, headers=headers, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, 'lxml')
 
                 # Extract text snippets
                 snippets = []
-                for g in soup.find_all('div', class_='g'):
+                for g in soup.select('div.g'):
                     snippet = g.get_text()
                     if snippet:
                         snippets.append(snippet[:500])
@@ -410,17 +477,18 @@ class LinkIntelligenceOrchestrator:
             'summary_bullets': [f"Bing search pending for {domain}"]
         }
 
-    def scrape_link_intelligence(self, url: str) -> Dict[str, Any]:
-        """
-        Scrape a URL for detailed intelligence.
+    def _retry_backoff(self, attempt: int) -> float:
+        """Random exponential backoff (full jitter, capped at 30s)."""
+        return random.uniform(1, min(30.0, 2 ** (attempt + 1)))
 
-        Args:
-            url: URL to scrape
+    @staticmethod
+    def _link_cache_key(url: str) -> bytes:
+        """Compact cache key for a URL (BLAKE2b is faster than SHA-256)."""
+        return hashlib.blake2b(url.encode(), digest_size=16).digest()
 
-        Returns:
-            Dictionary with scraped intelligence
-        """
-        intel = {
+    def _empty_scrape_intel(self) -> Dict[str, Any]:
+        """Return a fresh scrape-intel template dictionary."""
+        return {
             'title': '',
             'meta_description': '',
             'h1': '',
@@ -435,6 +503,179 @@ class LinkIntelligenceOrchestrator:
             'summary_bullets': []
         }
 
+    def _build_scrape_intel(self, url: str, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse scraped page content into a scrape-intel dictionary.
+
+        Args:
+            url: Source URL (used for deep scraping)
+            content: Page content (HTML or extracted text)
+            metadata: Pre-extracted metadata (title/description); derived from
+                      the content itself when empty
+
+        Returns:
+            Populated scrape-intel dictionary
+        """
+        intel = self._empty_scrape_intel()
+
+        soup = BeautifulSoup(content, 'lxml')
+
+        # Fall back to the page itself when no metadata was supplied
+        if not metadata:
+            title_tag = soup.find('title')
+            desc_tag = soup.find('meta', attrs={'name': 'description'})
+            metadata = {
+                'title': title_tag.get_text(strip=True) if title_tag else '',
+                'description': desc_tag.get('content', '') if desc_tag else ''
+            }
+
+        # Extract metadata
+        intel['title'] = metadata.get('title', '')[:100]
+        intel['meta_description'] = metadata.get('description', '')[:200]
+
+        # Extract H1
+        h1_tag = soup.find('h1')
+        if h1_tag:
+            intel['h1'] = h1_tag.get_text(strip=True)[:100]
+
+        # Extract value proposition (look for hero text)
+        hero_selectors = ['.hero', '.banner', '.jumbotron', 'section:first-of-type']
+        for selector in hero_selectors:
+            hero = soup.select_one(selector)
+            if hero:
+                hero_text = hero.get_text(strip=True)[:300]
+                if len(hero_text) > 50:
+                    intel['value_proposition'] = hero_text
+                    break
+
+        # Look for pricing/CTA: one precompiled alternation over the text
+        # nodes instead of a separate DOM walk per keyword
+        cta_elements = soup.find_all(string=_CTA_RE, limit=6)
+
+        if cta_elements:
+            intel['pricing_cta'] = 'Yes - ' + ', '.join([e.strip()[:30] for e in cta_elements[:3]])
+
+        # Extract contact methods
+        contact_methods = []
+
+        # Email extraction
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        emails = re.findall(email_pattern, str(soup))
+        if emails:
+            intel['emails'] = list(set(emails))[:5]
+            contact_methods.append(f"Email ({len(emails)} found)")
+
+        # Phone extraction
+        phone_pattern = r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
+        phones = re.findall(phone_pattern, str(soup))
+        if phones:
+            intel['phones'] = list(set(phones))[:3]
+            contact_methods.append(f"Phone ({len(phones)} found)")
+
+        # Forms detection
+        forms = soup.find_all('form')
+        if forms:
+            contact_methods.append(f"Forms ({len(forms)} found)")
+
+        intel['contact_capture'] = contact_methods
+
+        # Technology detection
+        tech_signals = []
+
+        # CMS detection
+        cms_patterns = {
+            'WordPress': ['wp-content', 'wp-includes', 'wordpress'],
+            'Shopify': ['shopify', 'myshopify.com', 'cdn.shopify'],
+            'Wix': ['wix.com', 'wixstatic.com'],
+            'Squarespace': ['squarespace.com', 'sqsp.net'],
+            'Webflow': ['webflow.io', 'webflow.com'],
+            'HubSpot': ['hubspot', 'hs-scripts', 'hsforms']
+        }
+
+        page_text = str(soup).lower()
+        for tech, patterns in cms_patterns.items():
+            if any(pattern in page_text for pattern in patterns):
+                tech_signals.append(f"CMS: {tech}")
+                break
+
+        # Analytics detection
+        analytics_patterns = {
+            'Google Analytics': ['google-analytics.com', 'gtag', 'ga.js'],
+            'Google Tag Manager': ['googletagmanager.com', 'gtm.js'],
+            'Facebook Pixel': ['facebook.com/tr', 'fbq'],
+            'Hotjar': ['hotjar.com', 'hjid'],
+            'Segment': ['segment.com', 'analytics.js']
+        }
+
+        for tech, patterns in analytics_patterns.items():
+            if any(pattern in page_text for pattern in patterns):
+                tech_signals.append(tech)
+
+        intel['tech_signals'] = tech_signals[:5]
+
+        # Social links extraction
+        social_domains = ['facebook.com', 'twitter.com', 'x.com', 'linkedin.com',
+                        'instagram.com', 'youtube.com', 'github.com']
+        social_links = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if any(domain in href for domain in social_domains):
+                social_links.append(href)
+
+        intel['social_links'] = list(set(social_links))[:5]
+
+        # Freshness detection (look for dates)
+        current_year = str(datetime.now().year)
+        if current_year in page_text:
+            intel['freshness'] = f"Current year ({current_year}) mentioned"
+        elif str(int(current_year) - 1) in page_text:
+            intel['freshness'] = f"Last year ({int(current_year) - 1}) mentioned"
+        else:
+            intel['freshness'] = "No recent dates found"
+
+        # Deep scrape if requested
+        if self.scrape_depth == 'deep':
+            intel = self._deep_scrape_pages(url, soup, intel)
+
+        # Generate summary bullets
+        bullets = []
+        if intel['title']:
+            bullets.append(f"Title: {intel['title'][:50]}")
+        if intel['value_proposition']:
+            bullets.append(f"Value: {intel['value_proposition'][:80]}")
+        if intel['pricing_cta']:
+            bullets.append(f"CTA: {intel['pricing_cta'][:50]}")
+        if intel['tech_signals']:
+            bullets.append(f"Tech: {', '.join(intel['tech_signals'][:3])}")
+        if intel['contact_capture']:
+            bullets.append(f"Contact: {', '.join(intel['contact_capture'])}")
+        if intel['social_links']:
+            bullets.append(f"Social: {len(intel['social_links'])} profiles found")
+        if intel['freshness']:
+            bullets.append(f"Freshness: {intel['freshness']}")
+
+        intel['summary_bullets'] = bullets[:10]
+
+        return intel
+
+    def scrape_link_intelligence(self, url: str) -> Dict[str, Any]:
+        """
+        Scrape a URL for detailed intelligence.
+
+        Args:
+            url: URL to scrape
+
+        Returns:
+            Dictionary with scraped intelligence
+        """
+        cache_key = self._link_cache_key(url)
+        if not self.force_refresh:
+            cached = self.link_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        intel = self._empty_scrape_intel()
+
         try:
             # Check robots.txt if respect is enabled
             if self.robots_respect and not self._check_robots_allowed(url):
@@ -448,142 +689,13 @@ class LinkIntelligenceOrchestrator:
             # Scrape with retry logic
             for attempt in range(self.retry_policy['attempts']):
                 try:
-                    result = self.scraper.scrape_url_with_retry(url)
+                    result = self.retryer(self.scraper.scrape_url_with_retry, url)
 
                     if result.get('status') == 'success':
-                        # Parse the content
-                        soup = BeautifulSoup(result.get('content', ''), 'html.parser')
-
-                        # Extract metadata
-                        intel['title'] = result.get('metadata', {}).get('title', '')[:100]
-                        intel['meta_description'] = result.get('metadata', {}).get('description', '')[:200]
-
-                        # Extract H1
-                        h1_tag = soup.find('h1')
-                        if h1_tag:
-                            intel['h1'] = h1_tag.get_text(strip=True)[:100]
-
-                        # Extract value proposition (look for hero text)
-                        hero_selectors = ['.hero', '.banner', '.jumbotron', 'section:first-of-type']
-                        for selector in hero_selectors:
-                            hero = soup.select_one(selector)
-                            if hero:
-                                hero_text = hero.get_text(strip=True)[:300]
-                                if len(hero_text) > 50:
-                                    intel['value_proposition'] = hero_text
-                                    break
-
-                        # Look for pricing/CTA
-                        cta_keywords = ['get started', 'try free', 'sign up', 'demo', 'pricing',
-                                      'plans', 'buy now', 'contact sales']
-                        cta_elements = []
-                        for keyword in cta_keywords:
-                            elements = soup.find_all(text=re.compile(keyword, re.IGNORECASE))
-                            cta_elements.extend(elements[:2])
-
-                        if cta_elements:
-                            intel['pricing_cta'] = 'Yes - ' + ', '.join([e.strip()[:30] for e in cta_elements[:3]])
-
-                        # Extract contact methods
-                        contact_methods = []
-
-                        # Email extraction
-                        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                        emails = re.findall(email_pattern, str(soup))
-                        if emails:
-                            intel['emails'] = list(set(emails))[:5]
-                            contact_methods.append(f"Email ({len(emails)} found)")
-
-                        # Phone extraction
-                        phone_pattern = r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
-                        phones = re.findall(phone_pattern, str(soup))
-                        if phones:
-                            intel['phones'] = list(set(phones))[:3]
-                            contact_methods.append(f"Phone ({len(phones)} found)")
-
-                        # Forms detection
-                        forms = soup.find_all('form')
-                        if forms:
-                            contact_methods.append(f"Forms ({len(forms)} found)")
-
-                        intel['contact_capture'] = contact_methods
-
-                        # Technology detection
-                        tech_signals = []
-
-                        # CMS detection
-                        cms_patterns = {
-                            'WordPress': ['wp-content', 'wp-includes', 'wordpress'],
-                            'Shopify': ['shopify', 'myshopify.com', 'cdn.shopify'],
-                            'Wix': ['wix.com', 'wixstatic.com'],
-                            'Squarespace': ['squarespace.com', 'sqsp.net'],
-                            'Webflow': ['webflow.io', 'webflow.com'],
-                            'HubSpot': ['hubspot', 'hs-scripts', 'hsforms']
-                        }
-
-                        page_text = str(soup).lower()
-                        for tech, patterns in cms_patterns.items():
-                            if any(pattern in page_text for pattern in patterns):
-                                tech_signals.append(f"CMS: {tech}")
-                                break
-
-                        # Analytics detection
-                        analytics_patterns = {
-                            'Google Analytics': ['google-analytics.com', 'gtag', 'ga.js'],
-                            'Google Tag Manager': ['googletagmanager.com', 'gtm.js'],
-                            'Facebook Pixel': ['facebook.com/tr', 'fbq'],
-                            'Hotjar': ['hotjar.com', 'hjid'],
-                            'Segment': ['segment.com', 'analytics.js']
-                        }
-
-                        for tech, patterns in analytics_patterns.items():
-                            if any(pattern in page_text for pattern in patterns):
-                                tech_signals.append(tech)
-
-                        intel['tech_signals'] = tech_signals[:5]
-
-                        # Social links extraction
-                        social_domains = ['facebook.com', 'twitter.com', 'x.com', 'linkedin.com',
-                                        'instagram.com', 'youtube.com', 'github.com']
-                        social_links = []
-                        for link in soup.find_all('a', href=True):
-                            href = link['href']
-                            if any(domain in href for domain in social_domains):
-                                social_links.append(href)
-
-                        intel['social_links'] = list(set(social_links))[:5]
-
-                        # Freshness detection (look for dates)
-                        current_year = str(datetime.now().year)
-                        if current_year in page_text:
-                            intel['freshness'] = f"Current year ({current_year}) mentioned"
-                        elif str(int(current_year) - 1) in page_text:
-                            intel['freshness'] = f"Last year ({int(current_year) - 1}) mentioned"
-                        else:
-                            intel['freshness'] = "No recent dates found"
-
-                        # Deep scrape if requested
-                        if self.scrape_depth == 'deep':
-                            intel = self._deep_scrape_pages(url, soup, intel)
-
-                        # Generate summary bullets
-                        bullets = []
-                        if intel['title']:
-                            bullets.append(f"Title: {intel['title'][:50]}")
-                        if intel['value_proposition']:
-                            bullets.append(f"Value: {intel['value_proposition'][:80]}")
-                        if intel['pricing_cta']:
-                            bullets.append(f"CTA: {intel['pricing_cta'][:50]}")
-                        if intel['tech_signals']:
-                            bullets.append(f"Tech: {', '.join(intel['tech_signals'][:3])}")
-                        if intel['contact_capture']:
-                            bullets.append(f"Contact: {', '.join(intel['contact_capture'])}")
-                        if intel['social_links']:
-                            bullets.append(f"Social: {len(intel['social_links'])} profiles found")
-                        if intel['freshness']:
-                            bullets.append(f"Freshness: {intel['freshness']}")
-
-                        intel['summary_bullets'] = bullets[:10]
+                        intel = self._build_scrape_intel(
+                            url, result.get('content', ''), result.get('metadata', {}))
+                        self.link_cache.set(cache_key, intel,
+                                            expire=LINK_CACHE_TTL_SECONDS)
                         break  # Success, exit retry loop
 
                     elif result.get('status') in ['blocked', 'not_found']:
@@ -591,10 +703,10 @@ class LinkIntelligenceOrchestrator:
                         break
 
                     else:
-                        # Retry with backoff
+                        # Retry with jittered backoff
                         if attempt < self.retry_policy['attempts'] - 1:
-                            backoff = self.retry_policy['backoff'][attempt]
-                            self.logger.info(f"Retry {attempt + 1} for {url} in {backoff}s")
+                            backoff = self._retry_backoff(attempt)
+                            self.logger.info(f"Retry {attempt + 1} for {url} in {backoff:.1f}s")
                             time.sleep(backoff)
                         else:
                             intel['summary_bullets'] = [f"Scrape failed after {attempt + 1} attempts"]
@@ -610,6 +722,79 @@ class LinkIntelligenceOrchestrator:
 
         return intel
 
+    async def _scrape_link_intelligence_async(self, session: aiohttp.ClientSession,
+                                              url: str) -> Dict[str, Any]:
+        """
+        Async counterpart of scrape_link_intelligence, fetching over a shared
+        aiohttp session.
+
+        Args:
+            session: Shared aiohttp client session
+            url: URL to scrape
+
+        Returns:
+            Dictionary with scraped intelligence
+        """
+        cache_key = self._link_cache_key(url)
+        if not self.force_refresh:
+            cached = await asyncio.to_thread(self.link_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        intel = self._empty_scrape_intel()
+
+        # Check robots.txt if respect is enabled (blocking read, so off-loop)
+        if self.robots_respect and not await asyncio.to_thread(self._check_robots_allowed, url):
+            intel['summary_bullets'] = ['Blocked by robots.txt']
+            return intel
+
+        headers = {
+            'User-Agent': f'{self.user_agent_id} Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+        for attempt in range(self.retry_policy['attempts']):
+            try:
+                async with session.get(url, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    if response.status == 200:
+                        html = await response.text(errors='ignore')
+                        # Parsing is CPU-bound; keep the event loop free
+                        intel = await asyncio.to_thread(
+                            self._build_scrape_intel, url, html, {})
+                        await asyncio.to_thread(
+                            self.link_cache.set, cache_key, intel,
+                            expire=LINK_CACHE_TTL_SECONDS)
+                        return intel
+
+                    if response.status in [404, 999]:
+                        intel['summary_bullets'] = [f"Page blocked/not found (HTTP {response.status})"]
+                        return intel
+
+                    if response.status in [403, 429]:
+                        # Honor server guidance and throttle the whole pipeline
+                        retry_after = response.headers.get('Retry-After', '')
+                        wait = int(retry_after) if retry_after.isdigit() else \
+                            self._retry_backoff(attempt)
+                        self._throttle_until = max(self._throttle_until,
+                                                   time.monotonic() + wait)
+                        self.logger.warning(f"Rate limited on {url}, backing off {wait}s")
+                        await asyncio.sleep(wait)
+                        continue
+
+                    if attempt < self.retry_policy['attempts'] - 1:
+                        await asyncio.sleep(self._retry_backoff(attempt))
+                    else:
+                        intel['summary_bullets'] = [f"Scrape failed after {attempt + 1} attempts"]
+
+            except Exception as e:
+                self.logger.error(f"Async scrape attempt {attempt + 1} failed for {url}: {e}")
+                if attempt == self.retry_policy['attempts'] - 1:
+                    intel['summary_bullets'] = [f"Error: {str(e)[:100]}"]
+                else:
+                    await asyncio.sleep(self._retry_backoff(attempt))
+
+        return intel
+
     def _check_robots_allowed(self, url: str) -> bool:
         """
         Check if URL is allowed by robots.txt.
@@ -1029,7 +1214,7 @@ class LinkIntelligenceOrchestrator:
             if ledger_key in self.processing_ledger and not self.force_refresh:
                 if self.processing_ledger[ledger_key] == 'done':
                     self.logger.info(f"  L{i+1} {url[:50]} → [SKIPPED - already processed]")
-                    self.stats['links_skipped'] += 1
+                    self.stats.links_skipped += 1
                     continue
 
             # Process the link
@@ -1055,7 +1240,7 @@ class LinkIntelligenceOrchestrator:
                 # Mark as processed
                 self.processing_ledger[ledger_key] = 'done'
                 self.links_processed_today += 1
-                self.stats['links_processed'] += 1
+                self.stats.links_processed += 1
 
                 self.logger.info(f"  L{i+1} {url[:50]} → writeback... [OK]")
 
@@ -1063,7 +1248,7 @@ class LinkIntelligenceOrchestrator:
                 self.logger.error(f"  L{i+1} {url[:50]} → [ERROR: {str(e)[:50]}]")
                 link_intel['error'] = str(e)
                 self.processing_ledger[ledger_key] = 'error'
-                self.stats['errors'] += 1
+                self.stats.errors += 1
 
             all_link_intel.append(link_intel)
 
@@ -1084,6 +1269,123 @@ class LinkIntelligenceOrchestrator:
 
         return enrichment_data
 
+    async def _process_link_async(self, session: aiohttp.ClientSession,
+                                  limiter: asyncio.BoundedSemaphore,
+                                  row_index: int, link_number: int, url: str) -> Dict[str, Any]:
+        """
+        Process one link (search + scrape) under the shared concurrency limiter.
+
+        Args:
+            session: Shared aiohttp client session
+            limiter: Bounded semaphore capping in-flight links
+            row_index: Row number (0-based)
+            link_number: 1-based link position within the row (for logging)
+            url: URL to process
+
+        Returns:
+            Link intelligence dictionary
+        """
+        async with limiter:
+            # Respect any pipeline-wide throttle requested by rate-limit headers
+            throttle = self._throttle_until - time.monotonic()
+            if throttle > 0:
+                await asyncio.sleep(throttle)
+
+            # Apply random delay (politeness, same policy as the sync path)
+            await asyncio.sleep(random.uniform(*self.delay_randomization_ms) / 1000)
+
+            link_intel = {
+                'url': url,
+                'search_intel': {},
+                'scrape_intel': {}
+            }
+
+            try:
+                self.logger.info(f"  L{link_number} {url[:50]} → search...")
+                link_intel['search_intel'] = await asyncio.to_thread(
+                    self.search_link_intelligence, url)
+
+                self.logger.info(f"  L{link_number} {url[:50]} → scrape...")
+                link_intel['scrape_intel'] = await self._scrape_link_intelligence_async(
+                    session, url)
+
+                # Mark as processed
+                self.processing_ledger[(row_index, url)] = 'done'
+                self.links_processed_today += 1
+                self.stats.links_processed += 1
+
+                self.logger.info(f"  L{link_number} {url[:50]} → writeback... [OK]")
+
+            except Exception as e:
+                self.logger.error(f"  L{link_number} {url[:50]} → [ERROR: {str(e)[:50]}]")
+                link_intel['error'] = str(e)
+                self.processing_ledger[(row_index, url)] = 'error'
+                self.stats.errors += 1
+
+            return link_intel
+
+    async def process_row_async(self, session: aiohttp.ClientSession,
+                                limiter: asyncio.BoundedSemaphore,
+                                row_index: int, row_data: List[str],
+                                headers: List[str]) -> Dict[str, Any]:
+        """
+        Async version of process_row: links in the row are fetched concurrently.
+
+        Args:
+            session: Shared aiohttp client session
+            limiter: Bounded semaphore capping in-flight links
+            row_index: Row number (0-based)
+            row_data: List of cell values
+            headers: List of column headers
+
+        Returns:
+            Dictionary with all enrichment data
+        """
+        # Create row dictionary for easier access
+        row_dict = {headers[i]: row_data[i] if i < len(row_data) else ''
+                   for i in range(len(headers))}
+
+        # Discover all links in the row
+        links = self.discover_links_in_row(row_data)
+
+        self.logger.info(f"[ROW {row_index + 1}] found {len(links)} links " +
+                        f"(processing up to {min(len(links), self.max_links_per_row)}; " +
+                        f"limit remaining: {self.daily_link_limit - self.links_processed_today})")
+
+        # Schedule each link; all links in the row run concurrently
+        tasks = []
+        for i, url in enumerate(links):
+            # Check daily limit (count in-flight links too)
+            if self.links_processed_today + len(tasks) >= self.daily_link_limit:
+                self.logger.warning(f"[LIMIT] Daily link limit reached ({self.daily_link_limit})")
+                break
+
+            # Check if already processed (idempotency)
+            ledger_key = (row_index, url)
+            if ledger_key in self.processing_ledger and not self.force_refresh:
+                if self.processing_ledger[ledger_key] == 'done':
+                    self.logger.info(f"  L{i+1} {url[:50]} → [SKIPPED - already processed]")
+                    self.stats.links_skipped += 1
+                    continue
+
+            tasks.append(self._process_link_async(session, limiter, row_index, i + 1, url))
+
+        all_link_intel = list(await asyncio.gather(*tasks)) if tasks else []
+
+        # Generate final report
+        final_report = self.generate_final_report(all_link_intel) if all_link_intel else "No links processed"
+
+        # Calculate lead score
+        lead_score, rationale = self.calculate_lead_score(row_dict, all_link_intel)
+
+        return {
+            'links': all_link_intel,
+            'final_report': final_report,
+            'lead_score': lead_score,
+            'lead_rationale': rationale,
+            'row_dict': row_dict
+        }
+
     def write_enrichment_to_sheet(self, row_index: int, enrichment_data: Dict[str, Any],
                                  sheet_data: List[List[str]]) -> bool:
         """
@@ -1165,7 +1467,7 @@ class LinkIntelligenceOrchestrator:
             # Write headers if needed
             if row_index == 1 or not self._headers_exist(headers, column_headers, start_col):
                 self._write_headers(column_headers, start_col)
-                self.stats['columns_created'] += len(column_headers)
+                self.stats.columns_created += len(column_headers)
 
             # Write row data
             self._write_row_data(row_index, columns_to_write, start_col)
@@ -1211,12 +1513,12 @@ class LinkIntelligenceOrchestrator:
             'values': [headers]
         }
 
-        self.service.spreadsheets().values().update(
+        self.retryer(self.service.spreadsheets().values().update(
             spreadsheetId=self.sheet_id,
             range=range_name,
             valueInputOption='USER_ENTERED',
             body=body
-        ).execute()
+        ).execute)
 
         self.logger.info(f"[WRITE] Created {len(headers)} column headers starting at {start_col_letter}")
 
@@ -1233,12 +1535,12 @@ class LinkIntelligenceOrchestrator:
             'values': [data]
         }
 
-        self.service.spreadsheets().values().update(
+        self.retryer(self.service.spreadsheets().values().update(
             spreadsheetId=self.sheet_id,
             range=range_name,
             valueInputOption='USER_ENTERED',
             body=body
-        ).execute()
+        ).execute)
 
     def _index_to_column_letter(self, index: int) -> str:
         """Convert column index to letter (0 -> A, 49 -> AX, etc)."""
@@ -1335,7 +1637,7 @@ class LinkIntelligenceOrchestrator:
         Returns:
             Statistics dictionary
         """
-        self.stats['start_time'] = datetime.now()
+        self.stats.start_time = datetime.now()
 
         self.logger.info("[START] Starting Link Intelligence Orchestrator")
         self.logger.info(f"Configuration: Sheet={self.sheet_id}, Tab={self.tab_name}, " +
@@ -1392,7 +1694,7 @@ class LinkIntelligenceOrchestrator:
                 if enrichment_data.get('links'):
                     self.write_enrichment_to_sheet(row_index, enrichment_data, sheet_data)
 
-                self.stats['rows_processed'] += 1
+                self.stats.rows_processed += 1
 
                 # Check daily limit
                 if self.links_processed_today >= self.daily_link_limit:
@@ -1404,23 +1706,115 @@ class LinkIntelligenceOrchestrator:
             self.logger.error(traceback.format_exc())
 
         # Final statistics
-        self.stats['end_time'] = datetime.now()
-        duration = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
+        self._log_final_stats()
+
+        return self.stats
+
+    async def run_async(self) -> Dict[str, Any]:
+        """
+        Async execution method: same flow as run(), but links are fetched
+        concurrently over a shared aiohttp session under a BoundedSemaphore.
+
+        Returns:
+            Statistics dictionary
+        """
+        self.stats.start_time = datetime.now()
+
+        self.logger.info("[START] Starting Link Intelligence Orchestrator (async)")
+        self.logger.info(f"Configuration: Sheet={self.sheet_id}, Tab={self.tab_name}, " +
+                        f"Scope={self.row_scope}, Daily Limit={self.daily_link_limit}, " +
+                        f"Concurrency={self.concurrency}")
+
+        # Authenticate
+        if not self.authenticate():
+            self.logger.error("Failed to authenticate with Google Sheets")
+            return self.stats
+
+        try:
+            # Get sheet data
+            range_name = f"{self.tab_name}!A:ZZ"
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range=range_name
+            ).execute()
+
+            sheet_data = result.get('values', [])
+
+            if not sheet_data:
+                self.logger.error("No data found in sheet")
+                return self.stats
+
+            headers = sheet_data[0]
+
+            # Determine row range
+            if self.row_scope == 'all rows':
+                start_row = 1  # Skip header
+                end_row = len(sheet_data)
+            else:
+                # Parse range like "2:500"
+                parts = self.row_scope.split(':')
+                start_row = int(parts[0]) - 1  # Convert to 0-based
+                end_row = min(int(parts[1]), len(sheet_data)) if len(parts) > 1 else len(sheet_data)
+
+            self.logger.info(f"Processing rows {start_row + 1} to {end_row}")
+
+            # One session + limiter shared across all links in the run
+            limiter = asyncio.BoundedSemaphore(self.concurrency)
+            connector = aiohttp.TCPConnector(limit=1024, limit_per_host=64)
+
+            async with aiohttp.ClientSession(connector=connector) as session:
+                # Process each row
+                for row_index in range(start_row, end_row):
+                    if row_index >= len(sheet_data):
+                        break
+
+                    row_data = sheet_data[row_index]
+
+                    # Skip empty rows
+                    if not any(row_data):
+                        continue
+
+                    # Process the row (links within the row run concurrently)
+                    enrichment_data = await self.process_row_async(
+                        session, limiter, row_index, row_data, headers)
+
+                    # Write enrichment to sheet
+                    if enrichment_data.get('links'):
+                        self.write_enrichment_to_sheet(row_index, enrichment_data, sheet_data)
+
+                    self.stats.rows_processed += 1
+
+                    # Check daily limit
+                    if self.links_processed_today >= self.daily_link_limit:
+                        self.logger.warning(f"Daily limit of {self.daily_link_limit} links reached")
+                        break
+
+        except Exception as e:
+            self.logger.error(f"Fatal error during processing: {e}")
+            self.logger.error(traceback.format_exc())
+
+        # Final statistics
+        self._log_final_stats()
+
+        return self.stats
+
+    def _log_final_stats(self):
+        """Log the final run statistics."""
+        self.stats.end_time = datetime.now()
+        duration = (self.stats.end_time - self.stats.start_time).total_seconds()
 
         self.logger.info("=" * 60)
         self.logger.info("FINAL STATISTICS")
         self.logger.info("=" * 60)
-        self.logger.info(f"Rows processed: {self.stats['rows_processed']}")
-        self.logger.info(f"Links found: {self.stats['links_found']}")
-        self.logger.info(f"Links processed: {self.stats['links_processed']}")
-        self.logger.info(f"Links skipped: {self.stats['links_skipped']}")
-        self.logger.info(f"Errors: {self.stats['errors']}")
-        self.logger.info(f"Columns created: {self.stats['columns_created']}")
+        self.logger.info(f"Rows processed: {self.stats.rows_processed}")
+        self.logger.info(f"Links found: {self.stats.links_found}")
+        self.logger.info(f"Links processed: {self.stats.links_processed}")
+        self.logger.info(f"Links skipped: {self.stats.links_skipped}")
+        self.logger.info(f"Errors: {self.stats.errors}")
+        self.logger.info(f"Columns created: {self.stats.columns_created}")
         self.logger.info(f"Duration: {duration:.2f} seconds")
         self.logger.info("=" * 60)
 
-        return self.stats
-
 
 if __name__ == "__main__":
     # Example configuration
@@ -1436,7 +1830,7 @@ if __name__ == "__main__":
         'USER_AGENT_ID': 'LinkIntelBot/1.0',
         'ROBOTS_RESPECT': True,
         'DELAY_RANDOMIZATION_MS': (800, 2500),
-        'RETRY_POLICY': {'attempts': 3, 'backoff': [2, 4, 8]},
+        'RETRY_POLICY': {'attempts': 3},
         'FORCE_REFRESH': False
     }
 
@@ -14,11 +14,12 @@ import hashlib
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import logging
 
-sys.path.append(os.path.dirname(__file__))
-
-from google_sheets_auth import authenticate_google_sheets
+# Cached provider keeps the module-level name that authenticate() resolves
+from google_sheets_auth import get_cached_credentials as authenticate_google_sheets
 from data_enrichment import DataEnrichment
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
@@ -31,6 +32,8 @@ COLUMN_SAFETY_MARGIN = 5
 MAX_FIELD_LENGTH = 1000
 MAX_REPORT_LENGTH = 20000
 BATCH_SIZE = 50
+READ_BATCH_MIN = 10
+READ_BATCH_MAX = 500
 
 # Required enrichment headers in order
 REQUIRED_ENRICH_HEADERS = [
@@ -72,6 +75,37 @@ OPTIONAL_ENRICH_HEADERS = [
     f"{ENRICH_PREFIX}Tech / Stack (|)"
 ]
 
+class BatchController:
+    """Sizes Sheets read batches from the enrichment backlog
+
+    When many rows are mid-flight the next values.get pulls a larger
+    range so quota is spent keeping the workers fed; when the pool
+    drains the reads shrink back so freshly fetched rows start sooner.
+    """
+
+    def __init__(self):
+        self.outstanding = 0
+
+    def next_batch_size(self) -> int:
+        """Rows to request next: twice the in-flight count, clamped"""
+        return max(READ_BATCH_MIN, min(READ_BATCH_MAX, 2 * self.outstanding))
+
+
+# Row fields checked (in order) when picking a progress display name
+_NAME_FIELDS = ('name', 'Name', 'full_name', 'Full Name', 'first_name', 'First Name')
+_ORG_FIELDS = ('company', 'Company', 'organization', 'Organization', 'organization_name')
+
+
+@lru_cache(maxsize=4096)
+def _display_name_cached(name: str, company: str) -> str:
+    """Format a display label; cached since retries re-see the same rows"""
+    if name:
+        return name[:30]  # Truncate for display
+    if company:
+        return f"({company[:25]})"  # Parentheses for company
+    return "Row data"
+
+
 @dataclass
 class EnrichmentResult:
     """Structured enrichment result"""
@@ -102,9 +136,12 @@ class EnrichmentResult:
 class NonDestructiveEnricher:
     """Non-destructive, append-only Google Sheets enricher"""
 
-    def __init__(self, sheet_id: str, dry_run: bool = False):
+    def __init__(self, sheet_id: str, dry_run: bool = False, batch_size: int = 50,
+                 max_workers: int = 8):
         self.sheet_id = sheet_id
         self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.max_workers = max_workers
         self.service = None
         self.drive_service = None
         self.enricher = DataEnrichment()
@@ -115,6 +152,17 @@ class NonDestructiveEnricher:
         self.enrich_columns = {}
         self.total_columns = 0
 
+        # Buffered writes (flushed every batch_size rows via values.batchUpdate).
+        # Flushes run on a dedicated writer thread so enriching the next
+        # batch overlaps the previous batchUpdate round trip. A failed
+        # flush puts its batch back for the next attempt; rows only count
+        # as updated once their flush lands
+        self._pending_updates = []
+        self._pending_rows = 0
+        self._rows_flushed = 0
+        self._write_executor = ThreadPoolExecutor(max_workers=1)
+        self._inflight_flush = None
+
         # CLI integration for progress tracking
         self.cli = None
 
@@ -137,8 +185,11 @@ class NonDestructiveEnricher:
         """Authenticate with Google Sheets"""
         try:
             self.logger.info("Authenticating with Google Sheets API...")
-            self.service = authenticate_google_sheets()
-            return self.service is not None
+            result = authenticate_google_sheets()
+            if result:
+                self.service, self.drive_service, _ = result
+                return True
+            return False
         except Exception as e:
             self.logger.error(f"Authentication failed: {e}")
             return False
@@ -440,20 +491,12 @@ class NonDestructiveEnricher:
                     self.logger.info(f"  {req['range']}: {req['values'][0][0][:100]}")
                 return True
 
-            # Execute batch update
-            if requests:
-                body = {
-                    'valueInputOption': 'RAW',
-                    'data': requests
-                }
-
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=self.sheet_id,
-                    body=body
-                ).execute()
+            # Buffer the update; one batchUpdate covers many rows
+            self._pending_updates.extend(requests)
+            self._pending_rows += 1
 
-                self.logger.info(f"Updated {result.get('totalUpdatedCells', 0)} cells in row {row_index + 1}")
-                return True
+            if len(self._pending_updates) >= self.batch_size:
+                return self.flush_pending_updates()
 
         except Exception as e:
             self.logger.error(f"Failed to write enrichment data: {e}")
@@ -461,6 +504,71 @@ class NonDestructiveEnricher:
 
         return True
 
+    def flush_pending_updates(self, wait: bool = False) -> bool:
+        """Flush buffered row updates in a single values.batchUpdate call
+
+        The API call runs on the writer thread so the next enrichment
+        batch overlaps the Sheets round trip (double-buffering). Only one
+        flush is in flight at a time, which keeps writes ordered. Pass
+        wait=True at end of run to block until everything has landed.
+        """
+        # Wait for the previous flush before starting the next one; a
+        # failed batch lands back in the buffer here and rides along with
+        # the one about to be submitted
+        ok = self._await_inflight_flush()
+
+        if self._pending_updates:
+            data, self._pending_updates = self._pending_updates, []
+            rows, self._pending_rows = self._pending_rows, 0
+            self._inflight_flush = self._write_executor.submit(
+                self._execute_batch_update, data, rows)
+
+        if wait:
+            ok = self._await_inflight_flush() and ok
+
+        return ok
+
+    def _await_inflight_flush(self) -> bool:
+        """Block on the in-flight flush (if any) and report its outcome
+
+        Runs on the caller's thread, so buffer bookkeeping needs no
+        locking: a successful flush bumps the flushed-row count, a
+        failed one restores its batch to the front of the buffer for
+        the next attempt instead of dropping it.
+        """
+        if self._inflight_flush is None:
+            return True
+        ok, data, rows = self._inflight_flush.result()
+        self._inflight_flush = None
+        if ok:
+            self._rows_flushed += rows
+        else:
+            self._pending_updates = data + self._pending_updates
+            self._pending_rows += rows
+        return ok
+
+    def _execute_batch_update(self, data: List[Dict],
+                              rows: int) -> Tuple[bool, List[Dict], int]:
+        """Issue one values.batchUpdate; runs on the writer thread"""
+        try:
+            body = {
+                'valueInputOption': 'RAW',
+                'data': data
+            }
+
+            result = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.sheet_id,
+                body=body
+            ).execute()
+
+            self.logger.info(f"Flushed {len(data)} buffered ranges "
+                             f"({result.get('totalUpdatedCells', 0)} cells updated)")
+            return True, data, rows
+
+        except Exception as e:
+            self.logger.error(f"Failed to flush batched updates (will retry): {e}")
+            return False, data, rows
+
     def process_sheet(self, max_rows: Optional[int] = None) -> Dict[str, Any]:
         """Process entire sheet with enrichment and progress tracking"""
         start_time = time.time()
@@ -474,6 +582,8 @@ class NonDestructiveEnricher:
             'errors': [],
             'elapsed_seconds': 0
         }
+        rows_queued = 0
+        rows_flushed_before = self._rows_flushed
 
         try:
             # Read existing headers
@@ -484,87 +594,129 @@ class NonDestructiveEnricher:
             # Ensure enrichment headers exist
             self.ensure_enrichment_headers(headers)
 
-            # Read all data
-            range_name = "A:ZZ" if not max_rows else f"A1:ZZ{max_rows + 1}"
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.sheet_id,
-                range=range_name
-            ).execute()
-
-            sheet_data = result.get('values', [])
-            if len(sheet_data) <= 1:
-                self.logger.warning("No data rows found")
-                return stats
-
-            # Update headers with enrichment columns
-            if self.enrich_columns:
-                headers = sheet_data[0]
-
-            # Process each data row
-            for idx in range(1, min(len(sheet_data), max_rows + 1 if max_rows else len(sheet_data))):
-                row = sheet_data[idx]
-                stats['rows_attempted'] += 1
-
-                # Convert row to dict
-                row_dict = {}
-                for col_idx, value in enumerate(row):
-                    if col_idx < len(headers):
-                        row_dict[headers[col_idx]] = value
-
-                # Get person/company name for progress display
-                person_name = self._get_display_name(row_dict)
-
-                # Update CLI progress - processing state
-                if self.cli:
-                    self.cli.update_progress(
-                        idx, person_name, "processing",
-                        f"Extracting URLs and data..."
-                    )
-
-                # Get or generate row key
-                row_key = self.get_row_key(row_dict, idx)
-
-                self.logger.info(f"Processing row {idx} ({person_name}) with key: {row_key}")
-
-                try:
-                    # Process the row
-                    enrichment_result = self.process_row(row_dict, idx)
-
-                    # Map to columns
-                    column_data = self.map_result_to_columns(enrichment_result)
-
-                    # Write enrichment data
-                    if self.write_enrichment_data(idx, row_key, column_data):
-                        stats['rows_updated'] += 1
-                        status = enrichment_result.enrichment_status.lower()
-                        stats[status] = stats.get(status, 0) + 1
-
-                        # Update CLI progress - success
+            # Enrich rows concurrently: each row is independent and spends
+            # most of its time waiting on scrape/API responses. Writes and
+            # stats stay on this thread, so the batch buffer needs no locking.
+            # Rows are read in adaptively sized chunks - the fuller the
+            # worker pool, the larger the next fetch.
+            controller = BatchController()
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                futures = {}
+                cursor = 1
+
+                while True:
+                    batch = controller.next_batch_size()
+                    # Unformatted values cut the JSON payload roughly 4x
+                    # versus locale-formatted strings
+                    result = self.service.spreadsheets().values().get(
+                        spreadsheetId=self.sheet_id,
+                        range=f"A{cursor}:ZZ{cursor + batch - 1}",
+                        valueRenderOption='UNFORMATTED_VALUE'
+                    ).execute()
+                    chunk = result.get('values', [])
+
+                    # Data-row index of the first row in this window (the
+                    # header in row 1 is index 0)
+                    rows = chunk
+                    start_idx = cursor - 1
+                    if cursor == 1:
+                        # First chunk carries the header row; take it fresh
+                        # in case enrichment columns were appended
+                        if chunk and self.enrich_columns:
+                            headers = chunk[0]
+                        rows = chunk[1:]
+                        start_idx = 1
+
+                    for offset, row in enumerate(rows):
+                        idx = start_idx + offset
+                        if max_rows and idx > max_rows:
+                            break
+                        # Convert row to dict (zip stops at the shorter
+                        # sequence). Unformatted cells can be numeric, so
+                        # coerce - downstream code handles strings
+                        row_dict = dict(zip(headers, (
+                            cell if isinstance(cell, str) else str(cell)
+                            for cell in row)))
+
+                        # Update CLI progress - processing state
                         if self.cli:
-                            details = f"{enrichment_result.source_count} sources, {enrichment_result.confidence}% confidence"
-                            self.cli.update_progress(idx, person_name, status, details)
-
-                    else:
+                            self.cli.update_progress(
+                                idx, self._get_display_name(row_dict), "processing",
+                                "Extracting URLs and data..."
+                            )
+                        future = executor.submit(self.process_row, row_dict, idx)
+                        futures[future] = (idx, row_dict)
+
+                    # Advance by the window size, not the row count:
+                    # values.get trims trailing blank rows from a window,
+                    # and a short chunk only means blanks, not end of sheet
+                    cursor += batch
+                    controller.outstanding = sum(
+                        1 for f in futures if not f.done())
+                    if not chunk or (max_rows and start_idx + len(rows) > max_rows):
+                        break
+
+                if not futures:
+                    self.logger.warning("No data rows found")
+                    return stats
+
+                for future in as_completed(futures):
+                    idx, row_dict = futures[future]
+                    stats['rows_attempted'] += 1
+
+                    # Get person/company name for progress display
+                    person_name = self._get_display_name(row_dict)
+
+                    # Get or generate row key
+                    row_key = self.get_row_key(row_dict, idx)
+
+                    self.logger.info(f"Processing row {idx} ({person_name}) with key: {row_key}")
+
+                    try:
+                        enrichment_result = future.result()
+
+                        # Map to columns
+                        column_data = self.map_result_to_columns(enrichment_result)
+
+                        # Write enrichment data
+                        # Buffered write; counted as updated only once
+                        # its flush lands
+                        if self.write_enrichment_data(idx, row_key, column_data):
+                            rows_queued += 1
+                            status = enrichment_result.enrichment_status.lower()
+                            stats[status] = stats.get(status, 0) + 1
+
+                            # Update CLI progress - success
+                            if self.cli:
+                                details = f"{enrichment_result.source_count} sources, {enrichment_result.confidence}% confidence"
+                                self.cli.update_progress(idx, person_name, status, details)
+
+                        else:
+                            stats['rows_skipped'] += 1
+                            stats['failed'] += 1
+
+                            # Update CLI progress - failed
+                            if self.cli:
+                                self.cli.update_progress(idx, person_name, "failed", "Write failed")
+
+                    except Exception as row_error:
+                        self.logger.error(f"Row {idx} processing failed: {row_error}")
                         stats['rows_skipped'] += 1
                         stats['failed'] += 1
+                        stats['errors'].append(f"Row {idx}: {str(row_error)}")
 
-                        # Update CLI progress - failed
+                        # Update CLI progress - error
                         if self.cli:
-                            self.cli.update_progress(idx, person_name, "failed", "Write failed")
-
-                except Exception as row_error:
-                    self.logger.error(f"Row {idx} processing failed: {row_error}")
-                    stats['rows_skipped'] += 1
-                    stats['failed'] += 1
-                    stats['errors'].append(f"Row {idx}: {str(row_error)}")
-
-                    # Update CLI progress - error
-                    if self.cli:
-                        self.cli.update_progress(idx, person_name, "failed", f"Error: {str(row_error)[:50]}")
+                            self.cli.update_progress(idx, person_name, "failed", f"Error: {str(row_error)[:50]}")
 
-                # Rate limiting
-                if not self.dry_run:
-                    time.sleep(self.scraper.get_request_delay("default"))
+            # Flush any updates still buffered below the batch threshold
+            # (including batches a mid-run flush failed to write) and
+            # wait for the in-flight write to land
+            if self.dry_run:
+                stats['rows_updated'] = rows_queued
+            else:
+                self.flush_pending_updates(wait=True)
+                stats['rows_updated'] = self._rows_flushed - rows_flushed_before
 
         except Exception as e:
             self.logger.error(f"Sheet processing failed: {e}")
@@ -587,19 +739,10 @@ class NonDestructiveEnricher:
 
     def _get_display_name(self, row_dict: Dict[str, str]) -> str:
         """Extract display name from row for progress tracking"""
-        # Try various name fields
-        name_fields = ['name', 'Name', 'full_name', 'Full Name', 'first_name', 'First Name']
-        for field in name_fields:
-            if field in row_dict and row_dict[field]:
-                return row_dict[field][:30]  # Truncate for display
-
-        # Try company/organization
-        org_fields = ['company', 'Company', 'organization', 'Organization', 'organization_name']
-        for field in org_fields:
-            if field in row_dict and row_dict[field]:
-                return f"({row_dict[field][:25]})"  # Parentheses for company
-
-        return f"Row data"
+        name = next((row_dict[f] for f in _NAME_FIELDS if row_dict.get(f)), "")
+        company = "" if name else next(
+            (row_dict[f] for f in _ORG_FIELDS if row_dict.get(f)), "")
+        return _display_name_cached(name, company)
 
     def _col_to_letter(self, col_index: int) -> str:
         """Convert column index to letter (0=A, 25=Z, 26=AA)"""
@@ -6,21 +6,22 @@ Handles sheets with too many columns by using only 5 enrichment columns
 
 import sys
 import os
-from cli_interface import CLIInterface
+from concurrent.futures import ThreadPoolExecutor
 
-sys.path.append(os.path.dirname(__file__))
+from cli_interface import CLIInterface
 
 from compact_enricher import CompactEnricher
 from google_sheets_auth import (
-    authenticate_google_sheets,
+    get_cached_credentials,
     parse_sheet_id_from_url,
     get_sheet_metadata,
-    preview_sheet_data,
     validate_sheet_access
 )
 
 def main():
     """Main function for compact enrichment"""
+    debug = '--debug' in sys.argv
+
     cli = CLIInterface()
 
     # Show banner
@@ -28,9 +29,25 @@ def main():
     cli.print_info("🎯 Compact Enrichment Mode - Uses only 5 columns!")
 
     try:
-        # Step 1: Authentication
+        # Step 1: Start authentication in the background so the service is
+        # ready by the time the user finishes typing the sheet URL
         cli.print_info("🔐 Connecting to Google...")
-        auth_result = authenticate_google_sheets(show_progress=True)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            auth_future = executor.submit(get_cached_credentials, show_progress=False)
+
+            # Step 2: Get sheet from user or use the one from error
+            sheet_input = cli.prompt_sheet_input()
+            if not sheet_input:
+                # Use the sheet ID from the error for quick testing
+                sheet_input = "1l5aAzy5bhilmB3XfEBUbnL6Le8z1t0hFlmzLA5Gwq50"
+                cli.print_info(f"Using sheet from previous error: {sheet_input}")
+
+            sheet_id = parse_sheet_id_from_url(sheet_input)
+            if not sheet_id:
+                cli.print_error("Invalid sheet ID or URL")
+                return 1
+
+            auth_result = auth_future.result()
 
         if not auth_result:
             cli.print_error("Google authentication failed")
@@ -38,18 +55,6 @@ def main():
 
         sheets_service, drive_service, creds = auth_result
 
-        # Step 2: Get sheet from user or use the one from error
-        sheet_input = cli.prompt_sheet_input()
-        if not sheet_input:
-            # Use the sheet ID from the error for quick testing
-            sheet_input = "1l5aAzy5bhilmB3XfEBUbnL6Le8z1t0hFlmzLA5Gwq50"
-            cli.print_info(f"Using sheet from previous error: {sheet_input}")
-
-        sheet_id = parse_sheet_id_from_url(sheet_input)
-        if not sheet_id:
-            cli.print_error("Invalid sheet ID or URL")
-            return 1
-
         # Step 3: Validate and get metadata
         cli.print_info("Validating sheet access...")
         valid, metadata = validate_sheet_access(sheets_service, drive_service, sheet_id)
@@ -62,13 +67,21 @@ def main():
         sheet_name = metadata['sheets'][0]['title']
         cli.print_info(f"Using worksheet: {sheet_name}")
 
-        # Step 5: Quick preview
-        preview_data = preview_sheet_data(sheets_service, sheet_id, sheet_name, max_rows=2)
-        if not preview_data:
+        # Step 5: Quick preview - one trimmed values.get; this runner only
+        # needs the header row, so skip preview_sheet_data's extra metadata call
+        preview = sheets_service.spreadsheets().values().get(
+            spreadsheetId=sheet_id,
+            range=f"'{sheet_name}'!A1:ZZ2",
+            majorDimension='ROWS',
+            fields='values'
+        ).execute()
+
+        preview_rows = preview.get('values', [])
+        if not preview_rows:
             cli.print_error("Cannot load preview")
             return 1
 
-        total_columns = len(preview_data.get('headers', []))
+        total_columns = len(preview_rows[0])
         cli.print_info(f"Sheet has {total_columns} columns")
 
         if total_columns > 55:
@@ -121,8 +134,11 @@ def main():
         return 1
     except Exception as e:
         cli.print_error(f"Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
+        else:
+            cli.print_info("Re-run with --debug for the full error trace")
         return 1
 
 if __name__ == "__main__":
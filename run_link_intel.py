@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Unified Link Intelligence Orchestrator Runner
+Single entry point for both the interactive CLI and the unattended auto run.
+
+Pass --auto for the hands-off configuration previously provided by
+run_link_intel_auto.py; everything else behaves like the interactive CLI
+from run_link_intelligence.py. The orchestrator (and the Google client
+libraries it pulls in) is imported only after arguments are validated,
+so --help returns without paying the import cost.
+"""
+
+import sys
+import os
+import json
+import asyncio
+import argparse
+import dataclasses
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import orjson
+
+# Defaults shared by both modes; mode-specific configs override these
+SHARED_CONFIG_DEFAULTS = {
+    'TAB_NAME': 'Sheet1',
+    'SEARCH_ENGINE': 'Google',
+    'SCRAPE_DEPTH': 'light',
+    'ARP_MODE': 'on',
+    'USER_AGENT_ID': 'LinkIntelBot/1.0',
+    'ROBOTS_RESPECT': True,
+    'DELAY_RANDOMIZATION_MS': (800, 2500),
+    'RETRY_POLICY': {'attempts': 3},
+    'FORCE_REFRESH': False,
+    'CONCURRENCY': 20
+}
+
+# Unattended run: conservative limits, slightly higher delays for safety
+AUTO_CONFIG = {
+    'SHEET_ID': '1l5aAzy5bhilmB3XfEBUbnL6Le8z1t0hFlmzLA5Gwq50',
+    'ROW_SCOPE': '2:20',
+    'DAILY_LINK_LIMIT': 100,
+    'MAX_LINKS_PER_ROW': 5,
+    'DELAY_RANDOMIZATION_MS': (1000, 3000),
+    'RETRY_POLICY': {'attempts': 2}
+}
+
+
+def build_config(**overrides) -> Dict[str, Any]:
+    """Build a configuration dict from the shared defaults plus overrides."""
+    config = dict(SHARED_CONFIG_DEFAULTS)
+    config.update(overrides)
+    return config
+
+
+def print_banner():
+    """Print the CLI banner."""
+    print("""
+==================================================================
+           LINK INTELLIGENCE ORCHESTRATOR v1.0
+         Comprehensive Link Analysis & Lead Scoring
+==================================================================
+    """)
+
+
+_prompt_session = None
+
+
+def _get_prompt_session():
+    """Build the shared prompt session on first use (tty-only feature)."""
+    global _prompt_session
+    if _prompt_session is None:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import FileHistory
+        _prompt_session = PromptSession(history=FileHistory('.leadshark_history'))
+    return _prompt_session
+
+
+def get_user_input(prompt: str, default: Any = None, value_type: type = str) -> Any:
+    """
+    Get user input with optional default value.
+
+    Previous answers (sheet IDs, ranges) are recallable with the up arrow
+    via a persistent prompt history; falls back to plain input() when no
+    interactive terminal is available.
+
+    Args:
+        prompt: Input prompt
+        default: Default value
+        value_type: Expected type
+
+    Returns:
+        User input or default
+    """
+    if default is not None:
+        prompt = f"{prompt} [{default}]: "
+    else:
+        prompt = f"{prompt}: "
+
+    try:
+        user_input = _get_prompt_session().prompt(prompt).strip()
+    except Exception:
+        user_input = input(prompt).strip()
+
+    if not user_input and default is not None:
+        return default
+
+    if value_type == bool:
+        return user_input.lower() in ['yes', 'y', 'true', '1', 'on']
+    elif value_type == int:
+        return int(user_input) if user_input else default
+    else:
+        return user_input
+
+
+def interactive_config() -> Dict[str, Any]:
+    """
+    Interactive configuration builder.
+
+    Returns:
+        Configuration dictionary
+    """
+    print("\n[CONFIGURATION SETUP]")
+    print("=" * 60)
+
+    config = build_config()
+
+    # Essential configuration
+    print("\nESSENTIAL SETTINGS:")
+    config['SHEET_ID'] = get_user_input("Google Sheet ID")
+    config['TAB_NAME'] = get_user_input("Tab/Sheet Name", "Sheet1")
+
+    # Row scope
+    print("\nROW SCOPE:")
+    print("  Options: 'all rows' or range like '2:100'")
+    config['ROW_SCOPE'] = get_user_input("Row Scope", "all rows")
+
+    # Link limits
+    print("\nLINK LIMITS:")
+    config['DAILY_LINK_LIMIT'] = get_user_input("Daily Link Limit", 500, int)
+    config['MAX_LINKS_PER_ROW'] = get_user_input("Max Links Per Row", 10, int)
+
+    # Search configuration
+    print("\nSEARCH CONFIGURATION:")
+    print("  Options: Google, Bing, API")
+    config['SEARCH_ENGINE'] = get_user_input("Search Engine", "Google")
+
+    # Scraping configuration
+    print("\nSCRAPING CONFIGURATION:")
+    print("  Options: 'light' (meta + hero) or 'deep' (key pages)")
+    config['SCRAPE_DEPTH'] = get_user_input("Scrape Depth", "light")
+
+    # ARP mode
+    print("\nAUTOMATED RESEARCH & PRODUCT (ARP):")
+    config['ARP_MODE'] = 'on' if get_user_input("Enable ARP Mode?", True, bool) else 'off'
+
+    # Advanced settings
+    print("\nADVANCED SETTINGS:")
+    show_advanced = get_user_input("Configure advanced settings?", False, bool)
+
+    if show_advanced:
+        config['USER_AGENT_ID'] = get_user_input("User Agent ID", "LinkIntelBot/1.0")
+        config['ROBOTS_RESPECT'] = get_user_input("Respect robots.txt?", True, bool)
+
+        # Delay randomization
+        min_delay = get_user_input("Min delay (ms)", 800, int)
+        max_delay = get_user_input("Max delay (ms)", 2500, int)
+        config['DELAY_RANDOMIZATION_MS'] = (min_delay, max_delay)
+
+        # Retry policy (backoff is jittered-exponential inside the orchestrator)
+        retry_attempts = get_user_input("Retry attempts", 3, int)
+        config['RETRY_POLICY'] = {'attempts': retry_attempts}
+
+        config['FORCE_REFRESH'] = get_user_input("Force refresh (ignore cache)?", False, bool)
+
+    return config
+
+
+def load_config_file(filepath: str) -> Dict[str, Any]:
+    """
+    Load configuration from JSON file.
+
+    Args:
+        filepath: Path to config file
+
+    Returns:
+        Configuration dictionary
+    """
+    return orjson.loads(Path(filepath).read_bytes())
+
+
+def save_config_file(config: Dict[str, Any], filepath: str):
+    """
+    Save configuration to JSON file.
+
+    Args:
+        config: Configuration dictionary
+        filepath: Path to save file
+    """
+    Path(filepath).write_bytes(
+        orjson.dumps(config, option=orjson.OPT_INDENT_2, default=str))
+    print(f"[OK] Configuration saved to {filepath}")
+
+
+def save_stats_file(stats: Dict[str, Any], filepath: str):
+    """
+    Stream run statistics to a JSON file.
+
+    Uses the stdlib incremental encoder so the serialized document is
+    written chunk by chunk instead of being buffered whole in memory
+    (orjson has no streaming encoder). Stats can carry per-link records,
+    so the document is not always small.
+
+    Args:
+        stats: Statistics dictionary from the orchestrator
+        filepath: Path to save file
+    """
+    encoder = json.JSONEncoder(indent=2, default=str)
+    with open(filepath, 'w') as f:
+        for chunk in encoder.iterencode(stats):
+            f.write(chunk)
+
+
+def run_orchestrator(config: Dict[str, Any]):
+    """
+    Run the Link Intelligence Orchestrator interactively.
+
+    Args:
+        config: Configuration dictionary
+    """
+    print("\n[STARTING LINK INTELLIGENCE ORCHESTRATOR]")
+    print("=" * 60)
+
+    # Display configuration in one write (single stdout lock/flush)
+    print("\nConfiguration Summary:")
+    sys.stdout.write('\n'.join(
+        f"  {key}: {value}" for key, value in config.items()
+        if key != 'SHEET_ID'  # Don't display full sheet ID
+    ) + '\n')
+
+    # Confirmation
+    print("\n")
+    if not get_user_input("Proceed with this configuration?", True, bool):
+        print("[CANCELLED] Operation cancelled")
+        return
+
+    # Deferred import: pulls in the Google client libraries
+    from link_intelligence_orchestrator import LinkIntelligenceOrchestrator
+
+    # Create and run orchestrator
+    try:
+        orchestrator = LinkIntelligenceOrchestrator(config)
+        stats = orchestrator.run()
+
+        # Display results
+        print("\n[COMPLETE] PROCESSING COMPLETE")
+        print("=" * 60)
+        print(f"Duration: {(stats.end_time - stats.start_time).total_seconds():.2f} seconds")
+
+        # Offer to save configuration
+        if get_user_input("\nSave this configuration for future use?", False, bool):
+            filename = get_user_input("Configuration filename", "link_intel_config.json")
+            save_config_file(config, filename)
+
+    except KeyboardInterrupt:
+        print("\n\n[WARNING] Processing interrupted by user")
+    except Exception as e:
+        print(f"\n[ERROR] Error: {e}")
+        import traceback
+        if get_user_input("Show full error trace?", False, bool):
+            traceback.print_exc()
+
+
+def run_auto(debug: bool = False):
+    """Run the Link Intelligence Orchestrator unattended."""
+    print("=" * 70)
+    print("         LINK INTELLIGENCE ORCHESTRATOR v1.0 - AUTO RUN")
+    print("=" * 70)
+
+    config = build_config(**AUTO_CONFIG)
+
+    print("\nConfiguration:")
+    print("-" * 50)
+    print(f"Sheet ID: {config['SHEET_ID'][:20]}...")
+    print(f"Tab Name: {config['TAB_NAME']}")
+    print(f"Row Scope: {config['ROW_SCOPE']}")
+    print(f"Daily Link Limit: {config['DAILY_LINK_LIMIT']}")
+    print(f"Max Links Per Row: {config['MAX_LINKS_PER_ROW']}")
+    print(f"Search Engine: {config['SEARCH_ENGINE']}")
+    print(f"Scrape Depth: {config['SCRAPE_DEPTH']}")
+    print(f"ARP Mode: {config['ARP_MODE']}")
+    print("-" * 50)
+
+    print("\n[STARTING] Initializing orchestrator...")
+
+    # Deferred import: pulls in the Google client libraries
+    from link_intelligence_orchestrator import LinkIntelligenceOrchestrator
+
+    try:
+        # Create orchestrator
+        orchestrator = LinkIntelligenceOrchestrator(config)
+
+        print("[RUNNING] Starting link intelligence processing...")
+        print("\nThis will:")
+        print("  1. Authenticate with Google Sheets")
+        print("  2. Read the configured rows from your sheet")
+        print("  3. Discover ALL links in every cell")
+        print("  4. Search and scrape each link")
+        print("  5. Calculate lead scores")
+        print("  6. Write results to columns after AX")
+        print("\n" + "=" * 70)
+
+        # Run the orchestrator (async pipeline overlaps link fetches)
+        stats = asyncio.run(orchestrator.run_async())
+
+        # Display results
+        print("\n" + "=" * 70)
+        print("[COMPLETE] Processing finished successfully!")
+        print("=" * 70)
+
+        if stats.start_time and stats.end_time:
+            duration = (stats.end_time - stats.start_time).total_seconds()
+            print(f"\nProcessing Statistics:")
+            print(f"  Duration: {duration:.2f} seconds")
+            print(f"  Rows Processed: {stats.rows_processed}")
+            print(f"  Links Found: {stats.links_found}")
+            print(f"  Links Processed: {stats.links_processed}")
+            print(f"  Links Skipped: {stats.links_skipped}")
+            print(f"  Errors: {stats.errors}")
+            print(f"  Columns Created: {stats.columns_created}")
+
+        print("\n[SUCCESS] Check your Google Sheet for the enriched data!")
+        print("         New columns have been added after column AX")
+
+        # Save stats to file (streamed, not buffered whole)
+        stats_file = f"link_intel_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        save_stats_file(dataclasses.asdict(stats), stats_file)
+        print(f"\n[SAVED] Statistics saved to {stats_file}")
+
+    except KeyboardInterrupt:
+        print("\n\n[INTERRUPTED] Processing stopped by user")
+    except Exception as e:
+        print(f"\n[ERROR] An error occurred: {e}")
+        if debug:
+            import traceback
+            print("\nFull error trace:")
+            traceback.print_exc()
+        else:
+            print("Re-run with --debug for the full error trace")
+
+    print("\n" + "=" * 70)
+    print("Link Intelligence Orchestrator - Session Complete")
+    print("=" * 70)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description='Link Intelligence Orchestrator CLI')
+    parser.add_argument('--auto', action='store_true', help='Run unattended with the auto configuration')
+    parser.add_argument('--config', type=str, help='Path to configuration JSON file')
+    parser.add_argument('--sheet-id', type=str, help='Google Sheet ID')
+    parser.add_argument('--tab', type=str, default='Sheet1', help='Sheet tab name')
+    parser.add_argument('--rows', type=str, default='all rows', help='Row scope')
+    parser.add_argument('--daily-limit', type=int, default=500, help='Daily link limit')
+    parser.add_argument('--max-per-row', type=int, default=10, help='Max links per row')
+    parser.add_argument('--search', type=str, default='Google', help='Search engine')
+    parser.add_argument('--depth', type=str, default='light', help='Scrape depth')
+    parser.add_argument('--arp', type=str, default='on', help='ARP mode (on/off)')
+    parser.add_argument('--force-refresh', action='store_true', help='Force refresh')
+    parser.add_argument('--debug', action='store_true', help='Print full tracebacks on errors')
+
+    args = parser.parse_args(argv)
+
+    if args.auto:
+        run_auto(debug=args.debug)
+        return
+
+    print_banner()
+
+    # Load or create configuration
+    if args.config:
+        print(f"[LOADING] Loading configuration from {args.config}")
+        config = load_config_file(args.config)
+    elif args.sheet_id:
+        # Build config from command line arguments
+        config = build_config(
+            SHEET_ID=args.sheet_id,
+            TAB_NAME=args.tab,
+            ROW_SCOPE=args.rows,
+            DAILY_LINK_LIMIT=args.daily_limit,
+            MAX_LINKS_PER_ROW=args.max_per_row,
+            SEARCH_ENGINE=args.search,
+            SCRAPE_DEPTH=args.depth,
+            ARP_MODE=args.arp,
+            FORCE_REFRESH=args.force_refresh
+        )
+    else:
+        # Interactive configuration
+        config = interactive_config()
+
+    # Run the orchestrator
+    run_orchestrator(config)
+
+    print("\nThank you for using Link Intelligence Orchestrator!")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,6 @@ import json
 import argparse
 from datetime import datetime
 
-sys.path.append(os.path.dirname(__file__))
-
 from non_destructive_enricher import NonDestructiveEnricher
 
 
@@ -35,8 +33,10 @@ def validate_environment():
     """Validate environment and dependencies"""
     issues = []
 
-    # Check for credentials file
-    if not os.path.exists('credentials.json'):
+    # Check for credentials file (single stat, no extra path probing)
+    try:
+        os.stat('credentials.json')
+    except FileNotFoundError:
         issues.append("❌ credentials.json not found - run authentication setup first")
 
     # Check for required modules
@@ -109,6 +109,11 @@ Examples:
         default=50,
         help='Batch size for updates (default: 50)'
     )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Print full tracebacks on errors'
+    )
 
     args = parser.parse_args()
 
@@ -139,7 +144,8 @@ Examples:
 
     enricher = NonDestructiveEnricher(
         sheet_id=args.sheet_id,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        batch_size=args.batch_size
     )
 
     # Authenticate
@@ -205,8 +211,11 @@ Examples:
 
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("   Re-run with --debug for the full error trace")
         return 1
 
 
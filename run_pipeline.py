@@ -10,47 +10,87 @@ Features:
 - Comprehensive error handling and recovery for maximum efficiency
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import argparse
+import contextlib
 import time
+from collections import Counter
 from datetime import datetime
-from pathlib import Path
+from functools import cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
-# Add current directory to path
-sys.path.append(str(Path(__file__).parent))
-
 try:
-    from cli_interface import CLIInterface, install_rich_hint
-    from google_sheets_auth import (
-        authenticate_google_sheets,
-        parse_sheet_id_from_url,
-        get_sheet_metadata,
-        preview_sheet_data,
-        validate_sheet_access
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_pipeline_modules():
+    """Import the heavy pipeline stack once argparse has validated intent
+
+    The Google client libraries and enrichers pull in hundreds of
+    submodules; deferring them keeps --help and argument errors instant.
+    """
+    try:
+        from cli_interface import CLIInterface, install_rich_hint
+        from google_sheets_auth import (
+            authenticate_google_sheets,
+            parse_sheet_id_from_url,
+            get_sheet_metadata,
+            get_sheet_bundle,
+            preview_sheet_data,
+            validate_sheet_access
+        )
+        from non_destructive_enricher import NonDestructiveEnricher
+        from compact_enricher import CompactEnricher
+        from enhanced_scraping_pipeline import EnhancedScrapingPipeline
+        from data_enrichment import DataEnrichment
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        print("Make sure all required files are in the current directory")
+        sys.exit(1)
+
+    globals().update(
+        CLIInterface=CLIInterface,
+        install_rich_hint=install_rich_hint,
+        authenticate_google_sheets=authenticate_google_sheets,
+        parse_sheet_id_from_url=parse_sheet_id_from_url,
+        get_sheet_metadata=get_sheet_metadata,
+        get_sheet_bundle=get_sheet_bundle,
+        preview_sheet_data=preview_sheet_data,
+        validate_sheet_access=validate_sheet_access,
+        NonDestructiveEnricher=NonDestructiveEnricher,
+        CompactEnricher=CompactEnricher,
+        EnhancedScrapingPipeline=EnhancedScrapingPipeline,
+        DataEnrichment=DataEnrichment,
     )
-    from non_destructive_enricher import NonDestructiveEnricher
-    from compact_enricher import CompactEnricher
-    from enhanced_scraping_pipeline import EnhancedScrapingPipeline
-    from data_enrichment import DataEnrichment
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    print("Make sure all required files are in the current directory")
-    sys.exit(1)
 
+@cache
 def load_config():
-    """Load configuration from environment or defaults"""
-    return {
+    """Load configuration from environment or defaults
+
+    Cached: the env vars are read and converted once, and callers share
+    one read-only mapping.
+    """
+    return MappingProxyType({
         'max_rows_per_batch': int(os.getenv('MAX_ROWS_PER_BATCH', '50')),
         'processing_delay': float(os.getenv('PROCESSING_DELAY', '2.0')),
         'log_level': os.getenv('LOG_LEVEL', 'INFO'),
         'rate_profile_multiplier': {
             'default': 1.0,
             'slow': 2.5
+        },
+        # Rows enriched at once per profile; 'slow' throttles concurrency
+        # as well as per-request delays
+        'rate_profile_workers': {
+            'default': 8,
+            'slow': 3
         }
-    }
+    })
 
 def interactive_sheet_selection(cli: CLIInterface, sheets_service, drive_service) -> Optional[Dict]:
     """Interactive sheet selection flow"""
@@ -69,11 +109,13 @@ def interactive_sheet_selection(cli: CLIInterface, sheets_service, drive_service
 
         cli.print_info(f"Validating sheet access...")
 
-        # Validate access and get metadata
-        valid, metadata = validate_sheet_access(sheets_service, drive_service, sheet_id)
-        if not valid:
+        # One bundled fetch: metadata plus previews of every worksheet,
+        # instead of separate metadata and per-worksheet preview calls
+        bundle = get_sheet_bundle(sheets_service, drive_service, sheet_id)
+        if not bundle:
             cli.print_error("Cannot access sheet. Please check permissions and try again.")
             continue
+        metadata = bundle['metadata']
 
         cli.print_success(f"🦈 LeadShark connected to hunting ground: {metadata['title']}")
 
@@ -82,9 +124,10 @@ def interactive_sheet_selection(cli: CLIInterface, sheets_service, drive_service
         if not sheet_name:
             continue
 
-        # Get preview
-        cli.print_info("Loading sheet preview...")
-        preview_data = preview_sheet_data(sheets_service, sheet_id, sheet_name)
+        # Preview came back with the bundle; fall back to a direct read
+        # if the batch fetch missed this worksheet
+        preview_data = bundle['previews'].get(sheet_name) or preview_sheet_data(
+            sheets_service, sheet_id, sheet_name)
         if not preview_data:
             cli.print_error("Cannot load sheet preview")
             continue
@@ -120,52 +163,43 @@ def process_with_live_progress(enricher: NonDestructiveEnricher, cli: CLIInterfa
     mode = f"{rows_to_process} rows" if max_rows else "all rows"
     progress = cli.create_progress_display(rows_to_process, mode, sheet_name, dry_run)
 
-    stats = {
-        'rows_attempted': 0,
-        'rows_updated': 0,
-        'ok': 0,
-        'partial': 0,
-        'failed': 0,
-        'skipped': 0,
-        'errors': [],
-        'start_time': time.time()
-    }
+    # Counter sums the integer fields instead of replacing them wholesale,
+    # so partial results from an interrupted run still accumulate correctly
+    counts = Counter(rows_attempted=0, rows_updated=0, ok=0, partial=0,
+                     failed=0, skipped=0)
+    errors = []
+    start_time = time.time()
 
     try:
-        with progress:
+        # Piped/CI runs get no rich display (progress is None); the
+        # no-op context keeps the processing path identical and
+        # update_progress falls back to plain-text lines
+        with progress or contextlib.nullcontext():
             # Setup enricher for progress tracking
             enricher.cli = cli  # Inject CLI for progress updates
 
             # Process the sheet
             result_stats = enricher.process_sheet(max_rows=max_rows)
 
-            # Merge stats
-            stats.update(result_stats)
+            # Merge stats (in-place update keeps zero-valued fields)
+            counts.update({k: result_stats.get(k, 0) for k in counts})
+            errors.extend(result_stats.get('errors', []))
 
     except KeyboardInterrupt:
         cli.print_warning("Processing interrupted by user")
-        stats['errors'].append("User interruption")
+        errors.append("User interruption")
     except Exception as e:
         cli.print_error(f"Processing failed: {e}")
-        stats['errors'].append(str(e))
+        errors.append(str(e))
 
-    stats['elapsed_time'] = time.time() - stats['start_time']
+    stats = dict(counts)
+    stats['errors'] = errors
+    stats['start_time'] = start_time
+    stats['elapsed_time'] = time.time() - start_time
     return stats
 
 def main():
     """Main execution function with interactive flow"""
-    # Initialize CLI interface
-    cli = CLIInterface()
-
-    # Check if rich is available
-    try:
-        import rich
-    except ImportError:
-        install_rich_hint()
-
-    # Show banner
-    cli.print_banner()
-
     # Parse command line arguments (for override options)
     parser = argparse.ArgumentParser(
         description='🦈 LeadShark - Predatory Lead Enrichment System',
@@ -189,9 +223,26 @@ Examples:
     parser.add_argument('--rate-profile', choices=['default', 'slow'], default='default',
                        help='Rate limiting profile')
     parser.add_argument('--force-auth', action='store_true', help='Force re-authentication')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore the on-disk scrape/enrichment cache')
 
     args = parser.parse_args()
 
+    # Arguments are valid — now pay the import cost
+    _load_pipeline_modules()
+
+    # Initialize CLI interface
+    cli = CLIInterface()
+
+    # Check if rich is available
+    try:
+        import rich
+    except ImportError:
+        install_rich_hint()
+
+    # Show banner
+    cli.print_banner()
+
     try:
         # Step 1: Google OAuth Authentication
         cli.print_info("[*] Connecting to Google...")
@@ -309,10 +360,17 @@ Examples:
         enricher.service = sheets_service
         enricher.drive_service = drive_service
 
+        # Honor cache opt-out
+        if args.no_cache:
+            enricher.scraper.use_cache = False
+            enricher.enricher.use_cache = False
+
         # Apply rate profile
         config = load_config()
         rate_multiplier = config['rate_profile_multiplier'].get(options['rate_profile'], 1.0)
         enricher.scraper.apply_rate_multiplier(rate_multiplier)
+        enricher.max_workers = config['rate_profile_workers'].get(
+            options['rate_profile'], enricher.max_workers)
 
         # Step 5: Process with Live Progress
         cli.print_info(f"[~] Processing {sheet_info['sheet_name']}...")
@@ -322,19 +380,26 @@ Examples:
         # Step 6: Show Final Summary
         cli.show_final_summary(stats, stats['elapsed_time'])
 
-        # Save processing log
+        # Save processing log (orjson's C encoder when available; the
+        # stats payload can carry thousands of per-row entries)
         log_file = f"sheets_processing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        with open(log_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'sheet_info': {
-                    'id': sheet_info['sheet_id'],
-                    'name': sheet_info['sheet_name'],
-                    'title': sheet_info['metadata']['title']
-                },
-                'options': options,
-                'stats': stats
-            }, f, indent=2)
+        log_payload = {
+            'timestamp': datetime.now().isoformat(),
+            'sheet_info': {
+                'id': sheet_info['sheet_id'],
+                'name': sheet_info['sheet_name'],
+                'title': sheet_info['metadata']['title']
+            },
+            'options': options,
+            'stats': stats
+        }
+        if orjson is not None:
+            with open(log_file, 'wb') as f:
+                f.write(orjson.dumps(log_payload, option=orjson.OPT_INDENT_2,
+                                     default=str))
+        else:
+            with open(log_file, 'w') as f:
+                json.dump(log_payload, f, indent=2, default=str)
 
         if options.get('dry_run'):
             cli.print_info("[~] Dry run completed - no changes were made to your sheet")
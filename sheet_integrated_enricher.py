@@ -9,12 +9,15 @@ import os
 import sys
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
 
-sys.path.append(os.path.dirname(__file__))
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional
 
-from google_sheets_auth import authenticate_google_sheets, read_sheet, write_to_sheet
+from google_sheets_auth import authenticate_google_sheets, read_sheet
 from data_enrichment import DataEnrichment
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
@@ -30,41 +33,72 @@ class GoogleSheetsIntegratedEnricher:
         self.enrichment_results = []
         self.processing_time = 0
 
+        # Report sections buffer their ranges here and land in one
+        # values.batchUpdate call instead of one round trip per section
+        self._pending_ranges = []
+
+        # Grid size fetched once per run (metadata only, no cell data)
+        self._column_count = None
+
+        # Flattened per-row view shared by the report sections
+        self._rows_view_cache = None
+
     def authenticate(self):
         """Authenticate with Google Sheets"""
         print("Authenticating with Google Sheets API...")
         self.service = authenticate_google_sheets()
         return self.service is not None
 
+    def get_column_count(self) -> int:
+        """Read the sheet's column count without fetching any cell data"""
+        if self._column_count is None:
+            try:
+                meta = self.service.spreadsheets().get(
+                    spreadsheetId=self.sheet_id,
+                    fields='sheets.properties.gridProperties'
+                ).execute()
+                grid = meta['sheets'][0]['properties']['gridProperties']
+                self._column_count = grid.get('columnCount', 26)
+            except Exception as e:
+                print(f"Could not read sheet dimensions: {e}")
+                self._column_count = 26
+
+        return self._column_count
+
     def find_first_empty_column(self) -> int:
         """Find the first completely empty column"""
         print("Scanning for empty columns...")
 
-        # Read a large range to check for empty columns
-        test_range = "A1:ZZ100"  # Check first 100 rows across all columns
+        # Only request the columns that actually exist instead of A1:ZZ
+        last_letter = self.column_index_to_letter(self.get_column_count() - 1)
+        test_range = f"A1:{last_letter}100"  # Check first 100 rows
         sheet_data = read_sheet(self.service, self.sheet_id, test_range)
 
         if not sheet_data:
             return 0  # Start from column A if no data
 
-        max_cols = 0
-        for row in sheet_data:
-            max_cols = max(max_cols, len(row))
+        # One vectorized pass over the padded block: a column is used when
+        # any row has a non-blank cell in it. The report section starts
+        # after the LAST used column - interior blank columns are user
+        # data layout, not free space, and writing into them would break
+        # the non-destructive guarantee.
+        df = pd.DataFrame(sheet_data).fillna('').astype(str)
+        column_used = df.apply(lambda col: col.str.strip().astype(bool)).any(axis=0)
+        used_columns = np.flatnonzero(column_used.to_numpy())
+
+        if used_columns.size:
+            return int(used_columns[-1]) + 1
 
-        # Find first completely empty column by checking if any row has data in that column
-        for col_index in range(max_cols, max_cols + 20):  # Check 20 columns beyond last used
-            has_data = False
-            for row in sheet_data:
-                if col_index < len(row) and row[col_index].strip():
-                    has_data = True
-                    break
-            if not has_data:
-                return col_index
+        return 0  # Sheet block is entirely blank; start from column A
 
-        return max_cols  # Default to next column after last used
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def column_index_to_letter(index: int) -> str:
+        """Convert column index to Excel-style letter
 
-    def column_index_to_letter(self, index: int) -> str:
-        """Convert column index to Excel-style letter"""
+        Memoized: the section builders call this in tight loops with the
+        same few indices.
+        """
         result = ""
         while index >= 0:
             result = chr(65 + (index % 26)) + result
@@ -100,66 +134,125 @@ class GoogleSheetsIntegratedEnricher:
 
         return columns
 
+    def _enrich_row(self, row_number: int, name: str, first_name: str,
+                    email: str, company: str, website: str,
+                    linkedin: str) -> Dict[str, Any]:
+        """Run all enrichment lookups for one row concurrently"""
+
+        # Initialize result
+        result = {
+            'row_number': row_number,
+            'name': name,
+            'email': email,
+            'company': company,
+            'website': website,
+            'linkedin': linkedin,
+            'enrichment': {}
+        }
+
+        # The four lookups hit independent services; fan them out and
+        # collect whichever ones apply
+        lookups = {}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            if first_name:
+                lookups['gender'] = pool.submit(self.enricher.get_gender, first_name)
+            if company:
+                lookups['github'] = pool.submit(self.enricher.search_github, company)
+            if website:
+                lookups['website'] = pool.submit(self.scraper.scrape_url_with_retry, website)
+            if linkedin:
+                lookups['linkedin'] = pool.submit(
+                    self.enricher.check_linkedin_profile_exists, linkedin)
+
+            for key, future in lookups.items():
+                result['enrichment'][key] = future.result()
+
+        return result
+
     def process_enrichment_data(self, data_rows: List[List[str]], columns: Dict[str, Optional[int]]) -> List[Dict[str, Any]]:
         """Process all rows and collect enrichment data"""
 
         print(f"Processing {len(data_rows)} rows for enrichment...")
-        results = []
-
-        for i, row in enumerate(data_rows, 2):  # Start from row 2
-            print(f"\nProcessing Row {i}: ", end="")
-
-            # Extract data
-            name = row[columns['name']] if columns['name'] and columns['name'] < len(row) else ""
-            first_name = row[columns['first_name']] if columns['first_name'] and columns['first_name'] < len(row) else ""
-            email = row[columns['email']] if columns['email'] and columns['email'] < len(row) else ""
-            company = row[columns['company']] if columns['company'] and columns['company'] < len(row) else ""
-            website = row[columns['website']] if columns['website'] and columns['website'] < len(row) else ""
-            linkedin = row[columns['linkedin']] if columns['linkedin'] and columns['linkedin'] < len(row) else ""
-
-            if not first_name and name:
-                first_name = name.split()[0] if name.split() else ""
-
-            print(f"{name}")
-
-            # Initialize result
-            result = {
-                'row_number': i,
-                'name': name,
-                'email': email,
-                'company': company,
-                'website': website,
-                'linkedin': linkedin,
-                'enrichment': {}
-            }
-
-            # Gender analysis
-            if first_name:
-                gender_result = self.enricher.get_gender(first_name)
-                result['enrichment']['gender'] = gender_result
-                time.sleep(1)
 
-            # GitHub search
-            if company:
-                github_result = self.enricher.search_github(company)
-                result['enrichment']['github'] = github_result
-                time.sleep(2)
+        # Vectorized field extraction: one padded DataFrame column per
+        # field instead of six guarded row[index] probes per row
+        df = pd.DataFrame(data_rows).fillna('').astype(str)
+
+        def column_values(col_index: Optional[int]) -> pd.Series:
+            if col_index is not None and col_index in df.columns:
+                return df[col_index]
+            return pd.Series([''] * len(df), index=df.index, dtype=str)
+
+        names = column_values(columns['name'])
+        first_names = column_values(columns['first_name'])
+        emails = column_values(columns['email'])
+        companies = column_values(columns['company'])
+        websites = column_values(columns['website'])
+        linkedins = column_values(columns['linkedin'])
+
+        # Fall back to the first word of the full name where the
+        # first-name column is empty
+        fallback = names.str.split().str[0].fillna('')
+        first_names = first_names.where(first_names.str.strip().astype(bool), fallback)
+
+        # Rows are independent: enrich several at once, bounded so the
+        # per-host rate limiter (not thread count) sets the request pace
+        with ThreadPoolExecutor(max_workers=min(5, len(data_rows)) or 1) as executor:
+            futures = []
+            row_fields = zip(names, first_names, emails, companies, websites, linkedins)
+            for i, fields in enumerate(row_fields, 2):  # Start from row 2
+                futures.append(executor.submit(self._enrich_row, i, *fields))
+
+            # Collect in submission order so results stay row-aligned
+            results = [future.result() for future in futures]
+
+        for result in results:
+            print(f"Row {result['row_number']}: {result['name']} - "
+                  f"{len(result['enrichment'])} lookups completed")
 
-            # Website scraping
-            if website:
-                scrape_result = self.scraper.scrape_url_with_retry(website)
-                result['enrichment']['website'] = scrape_result
-                time.sleep(2)
+        return results
 
-            # LinkedIn check
-            if linkedin:
-                linkedin_result = self.enricher.check_linkedin_profile_exists(linkedin)
-                result['enrichment']['linkedin'] = linkedin_result
-                time.sleep(1)
+    def _queue_write(self, range_name: str, values: List[List[Any]]):
+        """Buffer one ValueRange for the final batchUpdate"""
+        self._pending_ranges.append({'range': range_name, 'values': values})
 
-            results.append(result)
+    def _flush_writes(self):
+        """Write all buffered report sections in a single batchUpdate"""
+        if not self._pending_ranges:
+            return
 
-        return results
+        body = {
+            'valueInputOption': 'RAW',
+            'data': self._pending_ranges
+        }
+        result = self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.sheet_id,
+            body=body
+        ).execute()
+
+        print(f"  Wrote {len(self._pending_ranges)} sections in one batch "
+              f"({result.get('totalUpdatedCells', 0)} cells)")
+        self._pending_ranges = []
+
+    def _rows_view(self) -> List[Dict[str, Any]]:
+        """Flattened view of the enrichment results, built once
+
+        Every section re-read the same nested enrichment.get(...) chains
+        per row; resolving the sub-dicts here lets the sections iterate
+        plain locals instead.
+        """
+        if self._rows_view_cache is None:
+            self._rows_view_cache = [{
+                'row_number': result['row_number'],
+                'name': result['name'],
+                'company': result['company'],
+                'gender': result['enrichment'].get('gender', {}),
+                'github': result['enrichment'].get('github', {}),
+                'website': result['enrichment'].get('website', {}),
+                'linkedin': result['enrichment'].get('linkedin', {}),
+            } for result in self.enrichment_results]
+
+        return self._rows_view_cache
 
     def create_enrichment_data_section(self, start_col: int) -> int:
         """Create the enrichment data columns and return next available column"""
@@ -179,38 +272,33 @@ class GoogleSheetsIntegratedEnricher:
             'Processing_Notes'
         ]
 
-        # Write section header
-        header_range = f"{start_letter}1:{self.column_index_to_letter(start_col + len(enrichment_headers) - 1)}1"
-        write_to_sheet(self.service, self.sheet_id, header_range, [enrichment_headers])
-
-        # Prepare enrichment data
-        enrichment_data = []
-        for result in self.enrichment_results:
-            enrichment = result['enrichment']
-
+        # Header row and data rows are contiguous, so they ship as one
+        # ValueRange
+        enrichment_data = [enrichment_headers]
+        for row in self._rows_view():
             # Extract gender info
-            gender = enrichment.get('gender', {}).get('gender', 'unknown')
-            gender_conf = enrichment.get('gender', {}).get('probability', 0)
+            gender = row['gender'].get('gender', 'unknown')
+            gender_conf = row['gender'].get('probability', 0)
             gender_display = f"{gender_conf*100:.0f}%" if gender != 'unknown' else 'N/A'
 
             # Extract GitHub info
-            github_repos = enrichment.get('github', {}).get('total_repos', 0)
+            github_repos = row['github'].get('total_repos', 0)
 
             # Extract website info
-            website_status = "SUCCESS" if enrichment.get('website', {}).get('status') == 'success' else "FAILED"
-            website_title = enrichment.get('website', {}).get('metadata', {}).get('title', 'N/A')
+            website_status = "SUCCESS" if row['website'].get('status') == 'success' else "FAILED"
+            website_title = row['website'].get('metadata', {}).get('title', 'N/A')
             if len(website_title) > 30:
                 website_title = website_title[:30] + "..."
 
             # Extract LinkedIn info
-            linkedin_status = "ACCESSIBLE" if enrichment.get('linkedin', {}).get('accessible') else "BLOCKED"
+            linkedin_status = "ACCESSIBLE" if row['linkedin'].get('accessible') else "BLOCKED"
 
             # Processing notes
             notes = []
-            if enrichment.get('gender', {}).get('status') == 'success':
+            if row['gender'].get('status') == 'success':
                 notes.append("Gender: OK")
-            if enrichment.get('website', {}).get('status') == 'success':
-                content_len = enrichment.get('website', {}).get('full_content_length', 0)
+            if row['website'].get('status') == 'success':
+                content_len = row['website'].get('full_content_length', 0)
                 notes.append(f"Web: {content_len} chars")
             if github_repos > 0:
                 notes.append(f"GitHub: {github_repos} repos")
@@ -229,9 +317,9 @@ class GoogleSheetsIntegratedEnricher:
                 processing_notes
             ])
 
-        # Write enrichment data
-        data_range = f"{start_letter}2:{self.column_index_to_letter(start_col + len(enrichment_headers) - 1)}{len(enrichment_data) + 1}"
-        write_to_sheet(self.service, self.sheet_id, data_range, enrichment_data)
+        # Queue the section (header + data) for the final batch write
+        data_range = f"{start_letter}1:{self.column_index_to_letter(start_col + len(enrichment_headers) - 1)}{len(enrichment_data)}"
+        self._queue_write(data_range, enrichment_data)
 
         return start_col + len(enrichment_headers) + 2  # +2 for spacing
 
@@ -241,11 +329,12 @@ class GoogleSheetsIntegratedEnricher:
         start_letter = self.column_index_to_letter(start_col)
 
         # Calculate statistics
-        total_rows = len(self.enrichment_results)
-        gender_success = sum(1 for r in self.enrichment_results if r['enrichment'].get('gender', {}).get('status') == 'success')
-        github_success = sum(1 for r in self.enrichment_results if r['enrichment'].get('github', {}).get('status') == 'success')
-        website_success = sum(1 for r in self.enrichment_results if r['enrichment'].get('website', {}).get('status') == 'success')
-        linkedin_success = sum(1 for r in self.enrichment_results if r['enrichment'].get('linkedin', {}).get('status') == 'success')
+        rows = self._rows_view()
+        total_rows = len(rows)
+        gender_success = sum(1 for row in rows if row['gender'].get('status') == 'success')
+        github_success = sum(1 for row in rows if row['github'].get('status') == 'success')
+        website_success = sum(1 for row in rows if row['website'].get('status') == 'success')
+        linkedin_success = sum(1 for row in rows if row['linkedin'].get('status') == 'success')
 
         # Create report data
         report_data = [
@@ -282,9 +371,9 @@ class GoogleSheetsIntegratedEnricher:
             ['Security', 'No credentials stored in version control']
         ]
 
-        # Write report
+        # Queue the report for the final batch write
         report_range = f"{start_letter}1:{self.column_index_to_letter(start_col + 1)}{len(report_data)}"
-        write_to_sheet(self.service, self.sheet_id, report_range, report_data)
+        self._queue_write(report_range, report_data)
 
         return start_col + 3  # +3 for spacing
 
@@ -300,26 +389,24 @@ class GoogleSheetsIntegratedEnricher:
             ['Row', 'Name', 'Company', 'Gender', 'Website_Content_Length', 'LinkedIn_Status', 'Processing_Summary']
         ]
 
-        for result in self.enrichment_results:
-            enrichment = result['enrichment']
-
+        for row in self._rows_view():
             # Extract details
-            gender = enrichment.get('gender', {}).get('gender', 'unknown')
-            content_length = enrichment.get('website', {}).get('full_content_length', 0)
-            linkedin_accessible = enrichment.get('linkedin', {}).get('accessible', False)
+            gender = row['gender'].get('gender', 'unknown')
+            content_length = row['website'].get('full_content_length', 0)
+            linkedin_accessible = row['linkedin'].get('accessible', False)
             linkedin_status = 'ACCESSIBLE' if linkedin_accessible else 'BLOCKED/RESTRICTED'
 
             # Create processing summary
             summary_parts = []
-            if enrichment.get('gender', {}).get('status') == 'success':
-                conf = enrichment['gender'].get('probability', 0)
+            if row['gender'].get('status') == 'success':
+                conf = row['gender'].get('probability', 0)
                 summary_parts.append(f"Gender: {gender} ({conf*100:.0f}%)")
 
-            if enrichment.get('website', {}).get('status') == 'success':
-                title = enrichment['website'].get('metadata', {}).get('title', 'No title')[:30]
+            if row['website'].get('status') == 'success':
+                title = row['website'].get('metadata', {}).get('title', 'No title')[:30]
                 summary_parts.append(f"Web: {title}...")
 
-            github_repos = enrichment.get('github', {}).get('total_repos', 0)
+            github_repos = row['github'].get('total_repos', 0)
             if github_repos > 0:
                 summary_parts.append(f"GitHub: {github_repos} repos")
             else:
@@ -328,18 +415,18 @@ class GoogleSheetsIntegratedEnricher:
             processing_summary = "; ".join(summary_parts)
 
             detailed_data.append([
-                str(result['row_number']),
-                result['name'],
-                result['company'],
+                str(row['row_number']),
+                row['name'],
+                row['company'],
                 gender,
                 str(content_length),
                 linkedin_status,
                 processing_summary
             ])
 
-        # Write detailed results
+        # Queue the detailed results for the final batch write
         detailed_range = f"{start_letter}1:{self.column_index_to_letter(start_col + 6)}{len(detailed_data)}"
-        write_to_sheet(self.service, self.sheet_id, detailed_range, detailed_data)
+        self._queue_write(detailed_range, detailed_data)
 
         return start_col + 8  # +8 for spacing
 
@@ -360,9 +447,11 @@ class GoogleSheetsIntegratedEnricher:
             return False
         print("SUCCESS: Authenticated")
 
-        # Step 2: Read sheet data
+        # Step 2: Read sheet data, bounded to the columns that exist
         print("\nReading spreadsheet data...")
-        sheet_data = read_sheet(self.service, self.sheet_id, f"A1:Z{self.max_rows + 1}")
+        last_letter = self.column_index_to_letter(self.get_column_count() - 1)
+        sheet_data = read_sheet(self.service, self.sheet_id,
+                                f"A1:{last_letter}{self.max_rows + 1}")
 
         if not sheet_data or len(sheet_data) < 2:
             print("ERROR: Insufficient data")
@@ -406,6 +495,9 @@ class GoogleSheetsIntegratedEnricher:
         print("  Adding detailed results section...")
         current_col = self.create_detailed_results_section(current_col)
 
+        # Land all three sections in one Sheets API call
+        self._flush_writes()
+
         # Step 7: Final summary
         print(f"\n{'='*70}")
         print("INTEGRATED ENRICHMENT COMPLETED!")
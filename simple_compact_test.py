@@ -6,8 +6,6 @@ Simple Compact Enricher Test - No Rich formatting
 import sys
 import os
 
-sys.path.append(os.path.dirname(__file__))
-
 from compact_enricher import CompactEnricher
 from google_sheets_auth import authenticate_google_sheets
 
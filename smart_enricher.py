@@ -5,29 +5,119 @@ Automatically finds next available columns and generates comprehensive reports
 """
 
 import os
+import re
 import sys
 import json
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 # Add current directory to path
-sys.path.append(os.path.dirname(__file__))
 
-from google_sheets_auth import authenticate_google_sheets, read_sheet, write_to_sheet
+from google_sheets_auth import authenticate_google_sheets, read_sheet, batch_write_to_sheet
 from data_enrichment import DataEnrichment
-from enhanced_scraping_pipeline import EnhancedScrapingPipeline
+from enhanced_scraping_pipeline import EnhancedScrapingPipeline, HostRateLimiter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared read-only default for absent enrichment sections; never mutated
+_EMPTY = {}
+
+def _col_letter(index):
+    """Convert column index to Excel-style letter (0=A, 25=Z, 26=AA)"""
+    result = ""
+    while index >= 0:
+        result = chr(65 + (index % 26)) + result
+        index = index // 26 - 1
+    return result
+
+# Every letter a sheet can actually use (A..ZZ), computed once at import;
+# range building then becomes a list index instead of a loop
+_COL_LETTERS = [_col_letter(i) for i in range(702)]
+
+@dataclass
+class ColumnIdx:
+    """Resolved column positions for a sheet; -1 means the column is absent"""
+    email: int = -1
+    name: int = -1
+    first_name: int = -1
+    linkedin_url: int = -1
+    organization: int = -1
+    company_name: int = -1
+    website: int = -1
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Optional[int]]) -> 'ColumnIdx':
+        return cls(**{key: (-1 if index is None else index)
+                      for key, index in columns.items()})
+
+def _get(row: List[str], index: int) -> str:
+    """Cell at index, or '' when the column is absent or the row is short"""
+    return row[index] if 0 <= index < len(row) else ""
+
+@lru_cache(maxsize=2048)
+def _parse_organization(raw: str) -> Dict[str, Any]:
+    """Parse an organization JSON cell
+
+    The same organization blob repeats across rows from the same company,
+    so parses are memoized on the raw string. Callers must not mutate the
+    returned dict.
+    """
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, TypeError):
+        return _EMPTY
+    return data if isinstance(data, dict) else _EMPTY
+
+# Column detection tables: exact lowercase headers resolve with one dict
+# lookup; everything else runs the precompiled patterns in priority order.
+# The last flag keeps the original behavior where repeated matches for a
+# key take the last column seen instead of the first.
+_EXACT_HEADERS = {
+    'name': 'name',
+    'full_name': 'name',
+    'organization': 'organization',
+}
+_HEADER_PATTERNS = [
+    (re.compile(r'email'), 'email', False),
+    (re.compile(r'first_name'), 'first_name', False),
+    (re.compile(r'(?=.*linkedin)(?=.*url)'), 'linkedin_url', True),
+    (re.compile(r'company|organization_name'), 'company_name', True),
+    (re.compile(r'website'), 'website', False),
+]
 
 class SmartEnrichmentPipeline:
     """Smart enrichment pipeline that preserves existing data"""
 
-    def __init__(self, sheet_id: str, max_rows: int = 5):
+    # Minimum seconds between requests to the same API host. Unrelated
+    # hosts are never throttled against each other.
+    API_HOST_DELAYS = {
+        'api.eva.pingutil.com': 1.0,
+        'api.genderize.io': 0.5,
+        'api.github.com': 2.0,
+        'www.linkedin.com': 1.0,
+    }
+
+    def __init__(self, sheet_id: str, max_rows: int = 5, concurrency: Optional[int] = None):
         self.sheet_id = sheet_id
         self.max_rows = max_rows
+        # Cap on rows enriched at once; bounds in-flight HTTP requests
+        self.concurrency = concurrency if concurrency else min(10, max_rows)
         self.service = None
         self.enricher = DataEnrichment()
         self.scraper = EnhancedScrapingPipeline()
+        self.rate_limiter = HostRateLimiter()
         self.enrichment_results = []
+        # One wall-clock snapshot per run: every row shares the batch
+        # timestamp and both output filenames reuse the same stamp
+        self._batch_timestamp = datetime.now().isoformat()
 
     def authenticate(self):
         """Authenticate with Google Sheets"""
@@ -35,20 +125,28 @@ class SmartEnrichmentPipeline:
         self.service = authenticate_google_sheets()
         return self.service is not None
 
+    def get_column_count(self) -> int:
+        """Read the sheet's column count without fetching any cell data"""
+        try:
+            meta = self.service.spreadsheets().get(
+                spreadsheetId=self.sheet_id,
+                fields='sheets.properties.gridProperties'
+            ).execute()
+            grid = meta['sheets'][0]['properties']['gridProperties']
+            return grid.get('columnCount', 702)
+        except Exception as e:
+            print(f"Could not read sheet dimensions: {e}")
+            return 702
+
     def find_last_column(self, sheet_data: List[List[str]]) -> int:
         """Find the last column with data"""
-        max_col = 0
-        for row in sheet_data:
-            max_col = max(max_col, len(row))
-        return max_col
+        return max(map(len, sheet_data), default=0)
 
     def column_index_to_letter(self, index: int) -> str:
         """Convert column index to Excel-style letter (0=A, 25=Z, 26=AA)"""
-        result = ""
-        while index >= 0:
-            result = chr(65 + (index % 26)) + result
-            index = index // 26 - 1
-        return result
+        if 0 <= index < len(_COL_LETTERS):
+            return _COL_LETTERS[index]
+        return _col_letter(index)
 
     def detect_columns(self, headers: List[str]) -> Dict[str, Optional[int]]:
         """Detect important columns in the spreadsheet"""
@@ -65,54 +163,51 @@ class SmartEnrichmentPipeline:
         for i, header in enumerate(headers):
             header_lower = header.lower()
 
-            if 'email' in header_lower and columns['email'] is None:
-                columns['email'] = i
-            elif header_lower in ['name', 'full_name'] and columns['name'] is None:
-                columns['name'] = i
-            elif 'first_name' in header_lower and columns['first_name'] is None:
-                columns['first_name'] = i
-            elif 'linkedin' in header_lower and 'url' in header_lower:
-                columns['linkedin_url'] = i
-            elif header_lower == 'organization' and columns['organization'] is None:
-                columns['organization'] = i
-            elif 'company' in header_lower or 'organization_name' in header_lower:
-                columns['company_name'] = i
-            elif 'website' in header_lower and columns['website'] is None:
-                columns['website'] = i
+            exact_key = _EXACT_HEADERS.get(header_lower)
+            if exact_key is not None:
+                if columns[exact_key] is None:
+                    columns[exact_key] = i
+                continue
+
+            for pattern, key, take_last in _HEADER_PATTERNS:
+                if pattern.search(header_lower):
+                    if take_last or columns[key] is None:
+                        columns[key] = i
+                    break
 
         return columns
 
-    def process_row(self, row: List[str], columns: Dict[str, Optional[int]], row_number: int) -> Dict[str, Any]:
+    def process_row(self, row: List[str], idx: ColumnIdx, row_number: int) -> Dict[str, Any]:
         """Process a single row of data"""
-        print(f"\n{'='*50}")
-        print(f"PROCESSING ROW {row_number}")
-        print(f"{'='*50}")
+        # Buffer the row's console output and emit it with one print at
+        # the end: the stdout lock is taken once per row instead of ~15
+        # times, and concurrent rows can no longer interleave their lines
+        out = []
+        out.append(f"\n{'='*50}")
+        out.append(f"PROCESSING ROW {row_number}")
+        out.append(f"{'='*50}")
 
         # Extract data from row
-        email = row[columns['email']] if columns['email'] and columns['email'] < len(row) else ""
-        name = row[columns['name']] if columns['name'] and columns['name'] < len(row) else ""
-        first_name = row[columns['first_name']] if columns['first_name'] and columns['first_name'] < len(row) else ""
-        linkedin_url = row[columns['linkedin_url']] if columns['linkedin_url'] and columns['linkedin_url'] < len(row) else ""
+        email = _get(row, idx.email)
+        name = _get(row, idx.name)
+        first_name = _get(row, idx.first_name)
+        linkedin_url = _get(row, idx.linkedin_url)
 
         # Parse organization data if it's JSON
-        organization_data = {}
-        if columns['organization'] and columns['organization'] < len(row) and row[columns['organization']]:
-            try:
-                organization_data = json.loads(row[columns['organization']])
-            except:
-                pass
+        raw_organization = _get(row, idx.organization)
+        organization_data = _parse_organization(raw_organization) if raw_organization else _EMPTY
 
-        company_name = organization_data.get('name', '') or (row[columns['company_name']] if columns['company_name'] and columns['company_name'] < len(row) else "")
-        company_website = organization_data.get('website_url', '') or (row[columns['website']] if columns['website'] and columns['website'] < len(row) else "")
+        company_name = organization_data.get('name', '') or _get(row, idx.company_name)
+        company_website = organization_data.get('website_url', '') or _get(row, idx.website)
 
         if not first_name and name:
             first_name = name.split()[0] if name.split() else ""
 
-        print(f"Name: {name}")
-        print(f"Email: {email}")
-        print(f"Company: {company_name}")
-        print(f"Website: {company_website}")
-        print(f"LinkedIn: {linkedin_url}")
+        out.append(f"Name: {name}")
+        out.append(f"Email: {email}")
+        out.append(f"Company: {company_name}")
+        out.append(f"Website: {company_website}")
+        out.append(f"LinkedIn: {linkedin_url}")
 
         # Initialize enrichment result
         result = {
@@ -124,76 +219,80 @@ class SmartEnrichmentPipeline:
                 'website': company_website,
                 'linkedin': linkedin_url
             },
-            'enrichment_timestamp': datetime.now().isoformat(),
+            'enrichment_timestamp': self._batch_timestamp,
             'enrichment_results': {}
         }
 
         # Email verification
         if email and '@' in email:
-            print(f"\n  >> Verifying email: {email}")
+            out.append(f"\n  >> Verifying email: {email}")
+            self.rate_limiter.acquire('api.eva.pingutil.com',
+                                      self.API_HOST_DELAYS['api.eva.pingutil.com'])
             email_result = self.enricher.verify_email_eva(email)
             result['enrichment_results']['email_verification'] = email_result
 
             if email_result.get('status') == 'success':
                 deliverable = email_result.get('deliverable', False)
-                print(f"    Email Status: {'VALID' if deliverable else 'INVALID'}")
+                out.append(f"    Email Status: {'VALID' if deliverable else 'INVALID'}")
             else:
-                print(f"    Email Error: {email_result.get('error', 'Unknown')}")
-            time.sleep(1)
+                out.append(f"    Email Error: {email_result.get('error', 'Unknown')}")
 
         # Gender analysis
         if first_name:
-            print(f"\n  >> Analyzing gender for: {first_name}")
+            out.append(f"\n  >> Analyzing gender for: {first_name}")
+            self.rate_limiter.acquire('api.genderize.io',
+                                      self.API_HOST_DELAYS['api.genderize.io'])
             gender_result = self.enricher.get_gender(first_name)
             result['enrichment_results']['gender_analysis'] = gender_result
 
             if gender_result.get('status') == 'success':
                 gender = gender_result.get('gender', 'unknown')
                 probability = gender_result.get('probability', 0)
-                print(f"    Gender: {gender} ({probability*100:.0f}% confidence)")
-            time.sleep(1)
+                out.append(f"    Gender: {gender} ({probability*100:.0f}% confidence)")
 
         # GitHub search
         if company_name:
-            print(f"\n  >> Searching GitHub for: {company_name}")
+            out.append(f"\n  >> Searching GitHub for: {company_name}")
+            self.rate_limiter.acquire('api.github.com',
+                                      self.API_HOST_DELAYS['api.github.com'])
             github_result = self.enricher.search_github(company_name)
             result['enrichment_results']['github_search'] = github_result
 
             if github_result.get('status') == 'success':
                 orgs = github_result.get('total_orgs', 0)
                 repos = github_result.get('total_repos', 0)
-                print(f"    GitHub: {orgs} organizations, {repos} repositories")
-            time.sleep(2)
+                out.append(f"    GitHub: {orgs} organizations, {repos} repositories")
 
         # Website scraping
         if company_website:
-            print(f"\n  >> Scraping website: {company_website}")
+            out.append(f"\n  >> Scraping website: {company_website}")
             scrape_result = self.scraper.scrape_url_with_retry(company_website)
             result['enrichment_results']['website_scraping'] = scrape_result
 
             if scrape_result.get('status') == 'success':
                 content_length = scrape_result.get('full_content_length', 0)
-                print(f"    Website: SUCCESS ({content_length} chars)")
+                out.append(f"    Website: SUCCESS ({content_length} chars)")
 
                 if scrape_result.get('metadata', {}).get('title'):
                     title = scrape_result['metadata']['title'][:60]
-                    print(f"    Title: {title}...")
+                    out.append(f"    Title: {title}...")
             else:
-                print(f"    Website: FAILED - {scrape_result.get('status')}")
-            time.sleep(2)
+                out.append(f"    Website: FAILED - {scrape_result.get('status')}")
 
         # LinkedIn check
         if linkedin_url:
-            print(f"\n  >> Checking LinkedIn profile...")
+            out.append(f"\n  >> Checking LinkedIn profile...")
+            self.rate_limiter.acquire('www.linkedin.com',
+                                      self.API_HOST_DELAYS['www.linkedin.com'])
             linkedin_result = self.enricher.check_linkedin_profile_exists(linkedin_url)
             result['enrichment_results']['linkedin_check'] = linkedin_result
 
             if linkedin_result.get('status') == 'success':
                 accessible = linkedin_result.get('accessible', False)
-                print(f"    LinkedIn: {'ACCESSIBLE' if accessible else 'BLOCKED/RESTRICTED'}")
-            time.sleep(1)
+                out.append(f"    LinkedIn: {'ACCESSIBLE' if accessible else 'BLOCKED/RESTRICTED'}")
 
-        print(f"\nSUCCESS - Completed row {row_number}")
+        out.append(f"\nSUCCESS - Completed row {row_number}")
+        print('\n'.join(out))
         return result
 
     def generate_summary_data(self) -> List[List[str]]:
@@ -203,25 +302,31 @@ class SmartEnrichmentPipeline:
         for result in self.enrichment_results:
             enrichment = result['enrichment_results']
 
+            # Bind each section once instead of rebuilding default dicts
+            email_result = enrichment.get('email_verification') or _EMPTY
+            gender_result = enrichment.get('gender_analysis') or _EMPTY
+            github_result = enrichment.get('github_search') or _EMPTY
+            website_result = enrichment.get('website_scraping') or _EMPTY
+            linkedin_result = enrichment.get('linkedin_check') or _EMPTY
+
             # Extract key metrics
             email_status = "N/A"
-            if 'email_verification' in enrichment:
-                email_result = enrichment['email_verification']
+            if email_result:
                 if email_result.get('status') == 'success':
                     email_status = "VALID" if email_result.get('deliverable') else "INVALID"
                 elif email_result.get('status') == 'error':
                     email_status = "ERROR"
 
-            gender = enrichment.get('gender_analysis', {}).get('gender', 'unknown')
-            gender_conf = enrichment.get('gender_analysis', {}).get('probability', 0)
+            gender = gender_result.get('gender', 'unknown')
+            gender_conf = gender_result.get('probability', 0)
             gender_display = f"{gender} ({gender_conf*100:.0f}%)" if gender != 'unknown' else 'unknown'
 
-            github_repos = enrichment.get('github_search', {}).get('total_repos', 0)
+            github_repos = github_result.get('total_repos', 0)
             github_status = "FOUND" if github_repos > 0 else "NONE"
 
-            website_status = "SUCCESS" if enrichment.get('website_scraping', {}).get('status') == 'success' else "FAILED"
+            website_status = "SUCCESS" if website_result.get('status') == 'success' else "FAILED"
 
-            linkedin_status = "ACCESSIBLE" if enrichment.get('linkedin_check', {}).get('accessible') else "BLOCKED"
+            linkedin_status = "ACCESSIBLE" if linkedin_result.get('accessible') else "BLOCKED"
 
             summary_data.append([
                 result['enrichment_timestamp'][:10],  # Date only
@@ -237,50 +342,17 @@ class SmartEnrichmentPipeline:
     def generate_final_report(self) -> str:
         """Generate comprehensive final report"""
 
-        report = f"""
-# AETHON DATA ENRICHMENT REPORT
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Sheet ID:** {self.sheet_id}
-**Rows Processed:** {len(self.enrichment_results)}
-
----
-
-## PROCESSING SUMMARY
-
-**Total Rows:** {len(self.enrichment_results)}
-**Processing Time:** {self.processing_time:.1f} seconds
-**Average Time per Row:** {self.processing_time / len(self.enrichment_results):.1f} seconds
-
-### Success Rates:
-"""
+        # One pass over the results: bump success counters and build each
+        # row's markdown block, then join everything at the end instead of
+        # growing one string with repeated concatenation.
+        successes = Counter()
+        detail_parts = []
 
-        # Calculate success rates
-        email_success = sum(1 for r in self.enrichment_results if r['enrichment_results'].get('email_verification', {}).get('status') == 'success')
-        gender_success = sum(1 for r in self.enrichment_results if r['enrichment_results'].get('gender_analysis', {}).get('status') == 'success')
-        github_success = sum(1 for r in self.enrichment_results if r['enrichment_results'].get('github_search', {}).get('status') == 'success')
-        website_success = sum(1 for r in self.enrichment_results if r['enrichment_results'].get('website_scraping', {}).get('status') == 'success')
-        linkedin_success = sum(1 for r in self.enrichment_results if r['enrichment_results'].get('linkedin_check', {}).get('status') == 'success')
-
-        total = len(self.enrichment_results)
-
-        report += f"""
-- **Email Verification:** {email_success}/{total} ({email_success/total*100:.1f}%)
-- **Gender Analysis:** {gender_success}/{total} ({gender_success/total*100:.1f}%)
-- **GitHub Search:** {github_success}/{total} ({github_success/total*100:.1f}%)
-- **Website Scraping:** {website_success}/{total} ({website_success/total*100:.1f}%)
-- **LinkedIn Check:** {linkedin_success}/{total} ({linkedin_success/total*100:.1f}%)
-
----
-
-## DETAILED RESULTS
-
-"""
-
-        for i, result in enumerate(self.enrichment_results, 1):
+        for result in self.enrichment_results:
             original = result['original_data']
             enrichment = result['enrichment_results']
 
-            report += f"""
+            detail_parts.append(f"""
 ### Row {result['row_number']} - {original['name']}
 
 **Original Data:**
@@ -290,55 +362,95 @@ class SmartEnrichmentPipeline:
 - Website: {original['website']}
 
 **Enrichment Results:**
-"""
+""")
 
             # Email verification details
             if 'email_verification' in enrichment:
                 email_data = enrichment['email_verification']
                 if email_data.get('status') == 'success':
+                    successes['email'] += 1
                     deliverable = "VALID" if email_data.get('deliverable') else "INVALID"
-                    report += f"- **Email Status:** {deliverable}\n"
+                    detail_parts.append(f"- **Email Status:** {deliverable}\n")
                 else:
-                    report += f"- **Email Status:** ERROR - {email_data.get('error', 'Unknown')}\n"
+                    detail_parts.append(f"- **Email Status:** ERROR - {email_data.get('error', 'Unknown')}\n")
 
             # Gender analysis details
             if 'gender_analysis' in enrichment:
                 gender_data = enrichment['gender_analysis']
                 if gender_data.get('status') == 'success':
+                    successes['gender'] += 1
                     gender = gender_data.get('gender', 'unknown')
                     conf = gender_data.get('probability', 0)
                     count = gender_data.get('count', 0)
-                    report += f"- **Gender:** {gender} ({conf*100:.0f}% confidence, {count:,} samples)\n"
+                    detail_parts.append(f"- **Gender:** {gender} ({conf*100:.0f}% confidence, {count:,} samples)\n")
 
             # GitHub search details
             if 'github_search' in enrichment:
                 github_data = enrichment['github_search']
                 if github_data.get('status') == 'success':
+                    successes['github'] += 1
                     orgs = github_data.get('total_orgs', 0)
                     repos = github_data.get('total_repos', 0)
-                    report += f"- **GitHub:** {orgs} organizations, {repos} repositories\n"
+                    detail_parts.append(f"- **GitHub:** {orgs} organizations, {repos} repositories\n")
 
             # Website scraping details
             if 'website_scraping' in enrichment:
                 website_data = enrichment['website_scraping']
                 if website_data.get('status') == 'success':
+                    successes['website'] += 1
                     length = website_data.get('full_content_length', 0)
                     title = website_data.get('metadata', {}).get('title', 'No title')[:50]
-                    report += f"- **Website:** SUCCESS - Scraped ({length:,} chars) - {title}...\n"
+                    detail_parts.append(f"- **Website:** SUCCESS - Scraped ({length:,} chars) - {title}...\n")
                 else:
                     status = website_data.get('status', 'unknown')
-                    report += f"- **Website:** FAILED - {status}\n"
+                    detail_parts.append(f"- **Website:** FAILED - {status}\n")
 
             # LinkedIn check details
             if 'linkedin_check' in enrichment:
                 linkedin_data = enrichment['linkedin_check']
                 if linkedin_data.get('status') == 'success':
+                    successes['linkedin'] += 1
                     accessible = "ACCESSIBLE" if linkedin_data.get('accessible') else "BLOCKED/RESTRICTED"
-                    report += f"- **LinkedIn:** {accessible}\n"
+                    detail_parts.append(f"- **LinkedIn:** {accessible}\n")
+
+            detail_parts.append("\n---\n")
+
+        total = len(self.enrichment_results)
+        email_success = successes['email']
+        gender_success = successes['gender']
+        github_success = successes['github']
+        website_success = successes['website']
+        linkedin_success = successes['linkedin']
+
+        header = f"""
+# AETHON DATA ENRICHMENT REPORT
+**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Sheet ID:** {self.sheet_id}
+**Rows Processed:** {total}
+
+---
+
+## PROCESSING SUMMARY
+
+**Total Rows:** {total}
+**Processing Time:** {self.processing_time:.1f} seconds
+**Average Time per Row:** {self.processing_time / total:.1f} seconds
+
+### Success Rates:
+
+- **Email Verification:** {email_success}/{total} ({email_success/total*100:.1f}%)
+- **Gender Analysis:** {gender_success}/{total} ({gender_success/total*100:.1f}%)
+- **GitHub Search:** {github_success}/{total} ({github_success/total*100:.1f}%)
+- **Website Scraping:** {website_success}/{total} ({website_success/total*100:.1f}%)
+- **LinkedIn Check:** {linkedin_success}/{total} ({linkedin_success/total*100:.1f}%)
 
-            report += "\n---\n"
+---
 
-        report += f"""
+## DETAILED RESULTS
+
+"""
+
+        footer = f"""
 ## RECOMMENDATIONS
 
 Based on the enrichment results:
@@ -351,7 +463,7 @@ Based on the enrichment results:
 ## FILES GENERATED
 
 - **Enrichment Data:** Added to Google Sheets columns (next available)
-- **JSON Results:** Saved to `enrichment_results_[timestamp].json`
+- **JSON Results:** Saved to `enrichment_results_[timestamp].jsonl`
 - **Final Report:** This comprehensive analysis
 
 ---
@@ -360,7 +472,7 @@ Based on the enrichment results:
 *Powered by Claude Code Intelligence*
 """
 
-        return report
+        return "".join([header] + detail_parts + [footer])
 
     def run_pipeline(self):
         """Run the complete enrichment pipeline"""
@@ -372,6 +484,9 @@ Based on the enrichment results:
         print(f"Max Rows: {self.max_rows}")
 
         start_time = time.time()
+        batch_start = datetime.now()
+        self._batch_timestamp = batch_start.isoformat()
+        run_stamp = batch_start.strftime('%Y%m%d_%H%M%S')
 
         # Step 1: Authenticate
         if not self.authenticate():
@@ -379,18 +494,18 @@ Based on the enrichment results:
             return False
         print("SUCCESS: Authenticated successfully")
 
-        # Step 2: Read sheet data
+        # Step 2: Read the header row, trimmed to the sheet's real width
+        # instead of a blanket A1:ZZ fetch
         print(f"\nReading spreadsheet data...")
-        sheet_data = read_sheet(self.service, self.sheet_id, f"A1:ZZ{self.max_rows + 1}")
+        column_count = self.get_column_count()
+        last_letter = self.column_index_to_letter(column_count - 1)
+        header_data = read_sheet(self.service, self.sheet_id, f"A1:{last_letter}1")
 
-        if not sheet_data or len(sheet_data) < 2:
+        if not header_data or not header_data[0]:
             print("ERROR: Insufficient data in spreadsheet")
             return False
 
-        headers = sheet_data[0]
-        data_rows = sheet_data[1:]
-
-        print(f"SUCCESS: Found {len(data_rows)} data rows with {len(headers)} columns")
+        headers = header_data[0]
 
         # Step 3: Detect column structure
         columns = self.detect_columns(headers)
@@ -399,8 +514,26 @@ Based on the enrichment results:
             if col_index is not None:
                 print(f"  {col_name}: Column {col_index} ({headers[col_index]})")
 
-        # Step 4: Find next available column for enrichment data
-        last_col_index = self.find_last_column(sheet_data)
+        # Resolve detection results to plain integer indices once; rows then
+        # use attribute access instead of repeated dict/bounds checks
+        idx = ColumnIdx.from_columns(columns)
+
+        # Fetch data rows at the sheet's full width: placement below needs
+        # the true width of every row, and a narrower fetch would hide
+        # ragged rows wider than the header row
+        data_rows = read_sheet(self.service, self.sheet_id,
+                               f"A2:{last_letter}{self.max_rows + 1}")
+
+        if not data_rows:
+            print("ERROR: Insufficient data in spreadsheet")
+            return False
+
+        print(f"SUCCESS: Found {len(data_rows)} data rows with {len(headers)} columns")
+
+        # Step 4: Find next available column for enrichment data. The
+        # widest row - not just the header row - defines the used width,
+        # so ragged rows never get overwritten
+        last_col_index = self.find_last_column([headers] + data_rows)
         next_col_index = last_col_index + 1  # Add buffer column
         next_col_letter = self.column_index_to_letter(next_col_index)
 
@@ -408,12 +541,38 @@ Based on the enrichment results:
         print(f"  Last used column: {self.column_index_to_letter(last_col_index - 1)}")
         print(f"  Enrichment data will start at: {next_col_letter}")
 
-        # Step 5: Process each row
+        # Step 5: Process rows concurrently (results kept in sheet order)
         print(f"\nProcessing {len(data_rows)} rows...")
 
-        for i, row in enumerate(data_rows, 2):  # Start from row 2 (after header)
-            result = self.process_row(row, columns, i)
-            self.enrichment_results.append(result)
+        # Each finished row is appended to a JSONL file immediately, so a
+        # crash mid-run loses at most the rows still in flight; only the
+        # trimmed result (scraped page text dropped) stays in memory for
+        # the summary and report builders.
+        results_filename = f"enrichment_results_{run_stamp}.jsonl"
+        max_workers = min(self.concurrency, len(data_rows)) or 1
+        with open(results_filename, 'wb' if orjson is not None else 'w',
+                  encoding=None if orjson is not None else 'utf-8') as results_file, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.process_row, row, idx, i)
+                       for i, row in enumerate(data_rows, 2)]  # Start from row 2 (after header)
+            try:
+                for future in futures:
+                    result = future.result()
+                    if orjson is not None:
+                        results_file.write(orjson.dumps(result, default=str) + b'\n')
+                    else:
+                        results_file.write(json.dumps(result, ensure_ascii=False,
+                                                      default=str) + '\n')
+                    results_file.flush()
+                    scraping = result['enrichment_results'].get('website_scraping')
+                    if scraping:
+                        scraping.pop('content', None)
+                    self.enrichment_results.append(result)
+            except BaseException:
+                # Fail fast: the first row failure drops everything still
+                # queued so the remaining rows stop issuing HTTP calls
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
         # Step 6: Calculate processing time
         self.processing_time = time.time() - start_time
@@ -431,32 +590,32 @@ Based on the enrichment results:
             'LinkedIn_Status'
         ]
 
-        # Write headers
-        header_range = f"{next_col_letter}1:{self.column_index_to_letter(next_col_index + len(enrichment_headers) - 1)}1"
-        write_to_sheet(self.service, self.sheet_id, header_range, [enrichment_headers])
-
-        # Write summary data
+        # Write headers and summary data in a single batch call
+        end_col_letter = self.column_index_to_letter(next_col_index + len(enrichment_headers) - 1)
+        header_range = f"{next_col_letter}1:{end_col_letter}1"
         summary_data = self.generate_summary_data()
-        data_range = f"{next_col_letter}2:{self.column_index_to_letter(next_col_index + len(enrichment_headers) - 1)}{len(summary_data) + 1}"
-        write_to_sheet(self.service, self.sheet_id, data_range, summary_data)
+        data_range = f"{next_col_letter}2:{end_col_letter}{len(summary_data) + 1}"
+
+        # The Sheets round-trip and the report build are independent, so
+        # the write runs on a helper thread while the report is generated
+        # and saved; both have finished when the with-block exits
+        report_filename = f"enrichment_report_{run_stamp}.md"
+        with ThreadPoolExecutor(max_workers=1) as io_executor:
+            sheets_future = io_executor.submit(batch_write_to_sheet, self.service, self.sheet_id, [
+                {'range': header_range, 'values': [enrichment_headers]},
+                {'range': data_range, 'values': summary_data}
+            ])
 
-        print(f"SUCCESS: Enrichment data written to columns {next_col_letter}-{self.column_index_to_letter(next_col_index + len(enrichment_headers) - 1)}")
+            # Step 8: Detailed results were streamed to JSONL as rows finished
+            # Step 9: Generate and save final report while the write is in flight
+            final_report = self.generate_final_report()
+            with open(report_filename, 'w', encoding='utf-8') as f:
+                f.write(final_report)
 
-        # Step 8: Save detailed results to JSON
-        results_filename = f"enrichment_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(results_filename, 'w', encoding='utf-8') as f:
-            json.dump(self.enrichment_results, f, indent=2, ensure_ascii=False)
+            sheets_future.result()
 
+        print(f"SUCCESS: Enrichment data written to columns {next_col_letter}-{end_col_letter}")
         print(f"Detailed results saved to: {results_filename}")
-
-        # Step 9: Generate and save final report
-        print(f"\nGenerating final report...")
-        final_report = self.generate_final_report()
-
-        report_filename = f"enrichment_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            f.write(final_report)
-
         print(f"Final report saved to: {report_filename}")
 
         # Step 10: Display summary
@@ -6,8 +6,6 @@ Quick test for compact enricher
 import sys
 import os
 
-sys.path.append(os.path.dirname(__file__))
-
 from compact_enricher import CompactEnricher
 
 def test_compact_enricher():
@@ -4,17 +4,18 @@ Comprehensive Test Suite for Interactive CLI Flow
 Tests OAuth, sheet selection, progress tracking, and error handling
 """
 
+import io
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 
-sys.path.append(os.path.dirname(__file__))
-
 from google_sheets_auth import (
     parse_sheet_id_from_url,
     get_sheet_metadata,
+    get_sheet_bundle,
     validate_sheet_access,
     preview_sheet_data,
     authenticate_google_sheets
@@ -90,7 +91,7 @@ class TestOAuthFlow(unittest.TestCase):
         mock_oauth_service = Mock()
         mock_oauth_service.userinfo().get().execute.return_value = {'email': 'test@example.com'}
 
-        mock_build.side_effect = lambda service, version, credentials=None: (
+        mock_build.side_effect = lambda service, version, credentials=None, **kwargs: (
             mock_oauth_service if service == 'oauth2' else Mock()
         )
 
@@ -119,7 +120,7 @@ class TestOAuthFlow(unittest.TestCase):
 
         mock_sheets_service = Mock()
         mock_drive_service = Mock()
-        mock_build.side_effect = lambda service, version, credentials=None: (
+        mock_build.side_effect = lambda service, version, credentials=None, **kwargs: (
             mock_sheets_service if service == 'sheets' else mock_drive_service
         )
 
@@ -132,6 +133,41 @@ class TestOAuthFlow(unittest.TestCase):
         self.assertEqual(creds, mock_creds)
         mock_flow_instance.run_local_server.assert_called_once()
 
+        # Services must skip the discovery fetch and the legacy file cache
+        for build_call in mock_build.call_args_list:
+            if build_call.args and build_call.args[0] in ('sheets', 'drive'):
+                self.assertIs(build_call.kwargs.get('cache_discovery'), False)
+                self.assertIs(build_call.kwargs.get('static_discovery'), True)
+
+    @patch('google_sheets_auth.build')
+    @patch('google_sheets_auth.Credentials.from_authorized_user_file')
+    @patch('os.path.exists')
+    def test_credentials_cached(self, mock_exists, mock_creds_file, mock_build):
+        """Second call reuses cached services without rebuilding them"""
+        from google_sheets_auth import TokenProvider
+
+        mock_exists.side_effect = lambda path: path == 'token.json'
+        mock_creds = Mock()
+        mock_creds.valid = True
+        mock_creds.refresh_token = None
+        mock_creds.expiry = None
+        mock_creds.scopes = [
+            'https://www.googleapis.com/auth/spreadsheets',
+            'https://www.googleapis.com/auth/drive.readonly'
+        ]
+        mock_creds_file.return_value = mock_creds
+        mock_build.side_effect = lambda service, version, credentials=None, **kwargs: Mock()
+
+        provider = TokenProvider()
+        first = provider.get(show_progress=False)
+        build_calls_after_first = mock_build.call_count
+
+        second = provider.get(show_progress=False)
+
+        self.assertIsNotNone(first)
+        self.assertIs(first, second)
+        self.assertEqual(mock_build.call_count, build_calls_after_first)
+
     def test_authentication_failure(self):
         """Test authentication failure scenarios"""
         with patch('google_sheets_auth.build', side_effect=Exception("Auth failed")):
@@ -142,9 +178,28 @@ class TestOAuthFlow(unittest.TestCase):
 class TestSheetMetadata(unittest.TestCase):
     """Test sheet metadata retrieval"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Build the mock services once per class; individual tests only
+        # reset them. Cache the leaf mocks too - chained access like
+        # spreadsheets().get() walks the Mock auto-child machinery on
+        # every call
+        cls.mock_sheets_service = Mock()
+        cls.mock_drive_service = Mock()
+        spreadsheets = cls.mock_sheets_service.spreadsheets.return_value
+        cls.sheets_get_exec = spreadsheets.get.return_value.execute
+        cls.batch_get = spreadsheets.values.return_value.batchGet
+        cls.drive_get_exec = (
+            cls.mock_drive_service.files.return_value.get.return_value.execute)
+
     def setUp(self):
-        self.mock_sheets_service = Mock()
-        self.mock_drive_service = Mock()
+        # Clear call history on the trees and configuration on the
+        # leaves; resetting return_value on the services would detach
+        # the cached leaf mocks
+        self.mock_sheets_service.reset_mock()
+        self.mock_drive_service.reset_mock()
+        for leaf in (self.sheets_get_exec, self.drive_get_exec, self.batch_get):
+            leaf.reset_mock(return_value=True, side_effect=True)
 
     def test_get_sheet_metadata_success(self):
         """Test successful metadata retrieval"""
@@ -189,8 +244,8 @@ class TestSheetMetadata(unittest.TestCase):
             'modifiedTime': '2024-01-02T00:00:00.000Z'
         }
 
-        self.mock_sheets_service.spreadsheets().get().execute.return_value = mock_spreadsheet
-        self.mock_drive_service.files().get().execute.return_value = mock_file_info
+        self.sheets_get_exec.return_value = mock_spreadsheet
+        self.drive_get_exec.return_value = mock_file_info
 
         # Test
         metadata = get_sheet_metadata(self.mock_sheets_service, self.mock_drive_service, 'test_id')
@@ -202,6 +257,39 @@ class TestSheetMetadata(unittest.TestCase):
         self.assertEqual(metadata['sheets'][0]['title'], 'Sheet1')
         self.assertEqual(metadata['sheets'][1]['title'], 'Data')
 
+    def test_get_sheet_bundle_single_batch(self):
+        """Test bundled metadata + previews uses one batchGet for all sheets"""
+        mock_spreadsheet = {
+            'properties': {'title': 'Test Spreadsheet'},
+            'sheets': [
+                {'properties': {'sheetId': 0, 'title': 'Sheet1', 'index': 0,
+                                'gridProperties': {'rowCount': 100, 'columnCount': 26}}},
+                {'properties': {'sheetId': 1, 'title': 'Data', 'index': 1,
+                                'gridProperties': {'rowCount': 500, 'columnCount': 15}}}
+            ]
+        }
+
+        self.sheets_get_exec.return_value = mock_spreadsheet
+        self.drive_get_exec.return_value = {}
+        self.batch_get.return_value.execute.return_value = {
+            'valueRanges': [
+                {'values': [['name', 'email'], ['John', 'john@example.com']]},
+                {'values': [['company'], ['TechCorp']]}
+            ]
+        }
+
+        bundle = get_sheet_bundle(self.mock_sheets_service, self.mock_drive_service, 'test_id')
+
+        self.assertIsNotNone(bundle)
+        self.assertEqual(bundle['metadata']['title'], 'Test Spreadsheet')
+        self.assertEqual(bundle['previews']['Sheet1']['headers'], ['name', 'email'])
+        self.assertEqual(bundle['previews']['Sheet1']['preview_rows'], [['John', 'john@example.com']])
+        self.assertEqual(bundle['previews']['Data']['total_rows'], 499)
+
+        # Previews for both worksheets come from a single batch call
+        call_kwargs = self.batch_get.call_args.kwargs
+        self.assertEqual(len(call_kwargs['ranges']), 2)
+
     def test_get_sheet_metadata_403_error(self):
         """Test 403 permission error"""
         from googleapiclient.errors import HttpError
@@ -211,7 +299,7 @@ class TestSheetMetadata(unittest.TestCase):
         mock_response.status = 403
         error = HttpError(mock_response, b'Permission denied')
 
-        self.mock_sheets_service.spreadsheets().get().execute.side_effect = error
+        self.sheets_get_exec.side_effect = error
 
         metadata = get_sheet_metadata(self.mock_sheets_service, self.mock_drive_service, 'test_id')
         self.assertIsNone(metadata)
@@ -224,7 +312,7 @@ class TestSheetMetadata(unittest.TestCase):
         mock_response.status = 404
         error = HttpError(mock_response, b'Not found')
 
-        self.mock_sheets_service.spreadsheets().get().execute.side_effect = error
+        self.sheets_get_exec.side_effect = error
 
         metadata = get_sheet_metadata(self.mock_sheets_service, self.mock_drive_service, 'test_id')
         self.assertIsNone(metadata)
@@ -304,9 +392,14 @@ class TestCLIInterface(unittest.TestCase):
 class TestProgressIntegration(unittest.TestCase):
     """Test progress tracking integration with enricher"""
 
+    @classmethod
+    def setUpClass(cls):
+        # One enricher per class; tests only swap its service/cli
+        cls.enricher = NonDestructiveEnricher("test_sheet", dry_run=True)
+        cls.cli = CLIInterface()
+
     def setUp(self):
-        self.enricher = NonDestructiveEnricher("test_sheet", dry_run=True)
-        self.cli = CLIInterface()
+        self.enricher.service = None
         self.enricher.cli = self.cli
 
     def test_display_name_extraction(self):
@@ -336,7 +429,9 @@ class TestProgressIntegration(unittest.TestCase):
 
         # Mock service
         self.enricher.service = Mock()
-        self.enricher.service.spreadsheets().values().get().execute.return_value = {
+        values_get_exec = (self.enricher.service.spreadsheets.return_value
+                           .values.return_value.get.return_value.execute)
+        values_get_exec.return_value = {
             'values': [
                 ['name', 'email'],
                 ['John Doe', 'john@example.com'],
@@ -429,16 +524,27 @@ def run_integration_test():
             with progress:
                 for i in range(1, 4):
                     cli.update_progress(i, f"Person {i}", "processing", "Testing...")
-                    import time
-                    time.sleep(0.1)
                     cli.update_progress(i, f"Person {i}", "ok", "Test complete")
-                    time.sleep(0.1)
 
         cli.show_final_summary({'ok': 3, 'partial': 0, 'failed': 0, 'skipped': 0}, 2.5)
 
     print("✅ Integration test completed successfully!")
 
 
+def _run_one_class(class_name):
+    """Run a single TestCase class in a worker process
+
+    Output is captured rather than streamed so parallel runs don't
+    interleave; the parent prints it after the join.
+    """
+    test_class = globals()[class_name]
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = runner.run(suite)
+    return class_name, result.wasSuccessful(), stream.getvalue()
+
+
 def run_all_tests():
     """Run all test suites"""
     test_classes = [
@@ -452,17 +558,19 @@ def run_all_tests():
 
     all_passed = True
 
-    for test_class in test_classes:
-        print(f"\n{'='*50}")
-        print(f"Running {test_class.__name__}")
-        print('='*50)
-
-        suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-
-        if not result.wasSuccessful():
-            all_passed = False
+    # The classes are independent and mock-bound, so run them in
+    # parallel worker processes instead of one after another
+    with ProcessPoolExecutor(max_workers=len(test_classes)) as executor:
+        results = executor.map(_run_one_class,
+                               [c.__name__ for c in test_classes])
+        for class_name, passed, output in results:
+            print(f"\n{'='*50}")
+            print(f"Running {class_name}")
+            print('='*50)
+            print(output, end='')
+
+            if not passed:
+                all_passed = False
 
     print(f"\n{'='*50}")
     print("INTEGRATION TEST")
@@ -10,8 +10,6 @@ import os
 from unittest.mock import MagicMock, patch
 from typing import List, Dict, Any
 
-sys.path.append(os.path.dirname(__file__))
-
 from link_intelligence_orchestrator import LinkIntelligenceOrchestrator
 
 
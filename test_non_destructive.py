@@ -10,13 +10,14 @@ import sys
 import os
 from datetime import datetime, timezone
 
-sys.path.append(os.path.dirname(__file__))
-
 from non_destructive_enricher import (
     NonDestructiveEnricher,
     EnrichmentResult,
+    BatchController,
     ENRICH_PREFIX,
-    REQUIRED_ENRICH_HEADERS
+    REQUIRED_ENRICH_HEADERS,
+    READ_BATCH_MIN,
+    READ_BATCH_MAX
 )
 
 
@@ -327,6 +328,70 @@ class TestNonDestructiveEnricher(unittest.TestCase):
             mock_col.assert_any_call(9)  # Primary URL column
             mock_col.assert_any_call(10)  # Page Title column
 
+    def test_streaming_read_options(self):
+        """Test: Row reads use bounded ranges and unformatted values"""
+        self.enricher.dry_run = True
+        values_get = (self.mock_service.spreadsheets.return_value
+                      .values.return_value.get)
+        values_get.return_value.execute.return_value = {
+            'values': [
+                ["Name", "Email"],
+                ["John Doe", "john@example.com"]
+            ]
+        }
+
+        self.enricher.process_sheet(max_rows=1)
+
+        # The row fetch is a bounded chunk, not A:ZZ, and skips
+        # locale formatting to shrink the payload
+        kwargs = values_get.call_args.kwargs
+        self.assertEqual(kwargs['valueRenderOption'], 'UNFORMATTED_VALUE')
+        self.assertTrue(kwargs['range'].startswith('A1:ZZ'))
+
+    def test_adaptive_batch_sizing(self):
+        """Test: Read batch size grows with in-flight work and shrinks back"""
+        controller = BatchController()
+
+        # Empty pool starts at the floor
+        self.assertEqual(controller.next_batch_size(), READ_BATCH_MIN)
+
+        # Busy pool doubles the fetch
+        controller.outstanding = 40
+        self.assertEqual(controller.next_batch_size(), 80)
+
+        # Clamped at the ceiling
+        controller.outstanding = 400
+        self.assertEqual(controller.next_batch_size(), READ_BATCH_MAX)
+
+        # Drained pool shrinks back to the floor
+        controller.outstanding = 2
+        self.assertEqual(controller.next_batch_size(), READ_BATCH_MIN)
+
+    def test_batched_writes(self):
+        """Test: Row updates are coalesced into batchUpdate calls"""
+        enricher = NonDestructiveEnricher("test_sheet_id", dry_run=False,
+                                          batch_size=4)
+        mock_service = Mock()
+        enricher.service = mock_service
+        enricher.enrich_columns = {
+            f"{ENRICH_PREFIX}Row Key": 8,
+            f"{ENRICH_PREFIX}Primary URL": 9
+        }
+
+        # Each row buffers two ranges (row key + URL); 6 rows = 12 ranges
+        for row in range(6):
+            enricher.write_enrichment_data(
+                row_index=row,
+                row_key=f"key:{row}",
+                enrichment_data={f"{ENRICH_PREFIX}Primary URL": "https://x.com"}
+            )
+        enricher.flush_pending_updates(wait=True)
+
+        # 12 ranges at batch_size=4 -> 3 flushes, not 6 per-row writes
+        batch_update = mock_service.spreadsheets.return_value.values.return_value.batchUpdate
+        self.assertEqual(batch_update.call_count, 3)
+        mock_service.spreadsheets.return_value.values.return_value.update.assert_not_called()
+
     def test_dry_run_mode(self):
         """Test: Dry run mode doesn't make actual changes"""
         self.enricher.dry_run = True
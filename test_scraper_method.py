@@ -6,8 +6,6 @@ Test if scrape_url method exists
 import sys
 import os
 
-sys.path.append(os.path.dirname(__file__))
-
 from enhanced_scraping_pipeline import EnhancedScrapingPipeline
 
 def test_scraper():